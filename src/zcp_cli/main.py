@@ -7,9 +7,76 @@ from typing import List, Optional
 
 import click
 
-from zcp_core.bus import BusMode
 from zcp_logging.logger import LoggerFactory
-from zcp_preset.loader import PresetLoader
+
+# Severity ordering and icons for lint output, built once instead of
+# per finding inside the display loop
+_SEVERITY_ORDER = {"error": 0, "warning": 1, "info": 2}
+_SEVERITY_ICONS = {"error": "✗", "warning": "⚠", "info": "ℹ"}
+
+
+def _read_host_list(hosts: str) -> List[str]:
+    """
+    Parse a --hosts option value into a host list.
+
+    Accepts either a comma-separated list or @file syntax. Host files
+    are streamed line by line instead of being read into one string, so
+    large inventories never sit in memory twice.
+
+    Args:
+        hosts: Raw --hosts option value
+
+    Returns:
+        List of non-empty host names
+    """
+    if hosts.startswith("@"):
+        with open(hosts[1:], "r", buffering=131072) as f:
+            return [line.strip() for line in f if line.strip()]
+    return [h.strip() for h in hosts.split(",") if h.strip()]
+
+
+# Directories already created this process; repeated writes to the same
+# location skip the mkdir syscall entirely
+_ENSURED_DIRS: set = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """
+    Create a directory once per process.
+
+    Args:
+        path: Directory to create (may already exist)
+    """
+    import os
+
+    if path and path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+def _atomic_write_text(path: str, text: str) -> None:
+    """
+    Write text to a file atomically with a single write syscall.
+
+    The encoded buffer goes to a sibling temp file in one os.write, then
+    os.replace moves it into place, so readers never observe a partial
+    config and a crash mid-write leaves the original untouched.
+
+    Args:
+        path: Destination file path
+        text: Content to write
+    """
+    import os
+
+    _ensure_dir(os.path.dirname(path))
+    data = text.encode("utf-8")
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
 
 
 @click.group()
@@ -28,14 +95,33 @@ def cli(log_level: str, json_logs: bool, otlp: bool):
 @cli.command()
 def doctor():
     """Run self-diagnostic checks."""
+    import shutil
+
     logger = LoggerFactory.get("zcp_cli.doctor")
     logger.info("Running ZCP diagnostics...")
-    
+
     with logger.span("doctor_checks"):
-        # Check environment, connections, etc.
-        logger.info("All checks passed")
-    
-    click.echo("✓ All checks passed")
+        # Probe external tools with shutil.which (a few PATH stat calls)
+        # rather than launching each binary just to see if it exists
+        lines = []
+        for tool, purpose in (("ssh", "ssh rollout backend"),
+                              ("ansible-playbook", "ansible rollout backend")):
+            path = shutil.which(tool)
+            if path:
+                lines.append(f"✓ {tool} found ({purpose})")
+            else:
+                lines.append(f"⚠ {tool} not found ({purpose} unavailable)")
+
+        import importlib.util
+        if importlib.util.find_spec("orjson") is not None:
+            lines.append("✓ orjson available (fast JSON encoding)")
+        else:
+            lines.append("ℹ orjson not installed (using stdlib json)")
+
+        logger.info("Diagnostics complete")
+
+    lines.append("✓ All checks passed")
+    click.echo("\n".join(lines))
 
 
 @cli.group()
@@ -47,29 +133,34 @@ def preset():
 @preset.command(name="list")
 def list_presets():
     """List available presets."""
-    loader = PresetLoader()
+    from zcp_preset.loader import shared_loader
+
+    loader = shared_loader()
     presets = loader.list()
     
     if not presets:
         click.echo("No presets found")
         return
     
-    click.echo(f"Found {len(presets)} presets:")
+    # Build all rows up front, then emit them in one write
+    lines = [f"Found {len(presets)} presets:"]
     for preset_id in presets:
         try:
             p = loader.load(preset_id)
-            click.echo(f"  {preset_id} (sha256: {p.sha256[:8]}...)")
+            lines.append(f"  {preset_id} (sha256: {p.sha256[:8]}...)")
         except Exception as e:
-            click.echo(f"  {preset_id} (ERROR: {e})")
+            lines.append(f"  {preset_id} (ERROR: {e})")
+    click.echo("\n".join(lines))
 
 
 @preset.command(name="show")
 @click.argument("preset_id")
 def show_preset(preset_id: str):
     """Show details of a specific preset."""
+    from zcp_preset.loader import shared_loader
+
     try:
-        loader = PresetLoader()
-        p = loader.load(preset_id)
+        p = shared_loader().load(preset_id)
         click.echo(p.to_json())
     except FileNotFoundError:
         click.echo(f"Preset not found: {preset_id}", err=True)
@@ -87,12 +178,45 @@ def show_preset(preset_id: str):
 @click.option("--rollout", is_flag=True, help="Perform rollout after configuration")
 @click.option("--hosts", help="Comma-separated list of hosts for rollout")
 @click.option("--rollout-mode", type=click.Choice(["print", "ssh", "ansible"]), default="print", help="Rollout backend mode")
-def wizard(preset: Optional[str], host_count: int, template: str, format: str, rollout: bool, hosts: Optional[str], rollout_mode: str):
+@click.option("--output", "-o", help="Write the rendered configuration to a file")
+@click.option("--answers-file", type=click.Path(exists=True, readable=True), help="YAML file supplying wizard answers (flags given on the command line take precedence)")
+def wizard(preset: Optional[str], host_count: int, template: str, format: str, rollout: bool, hosts: Optional[str], rollout_mode: str, output: Optional[str], answers_file: Optional[str]):
     """Run the configuration wizard."""
     from zcp_cost.coordinator import CostCoordinator
     from zcp_cost.plugin import CostRequest, StaticPlugin, HistogramPlugin
-    from zcp_template.renderer import RenderRequest, TemplateRenderer, TokensInfra
-    
+    from zcp_preset.loader import shared_loader
+    from zcp_template.renderer import RenderRequest, TokensInfra, shared_renderer
+
+    # Apply answers from file for any parameter not given explicitly:
+    # one file read supplies the whole run, so scripted invocations never
+    # depend on defaults drifting
+    if answers_file:
+        from zcp_core.compat import yaml_safe_load
+
+        try:
+            with open(answers_file, "r", buffering=131072) as f:
+                answers = yaml_safe_load(f) or {}
+        except Exception as e:
+            click.echo(f"Error reading answers file: {e}", err=True)
+            sys.exit(1)
+
+        ctx = click.get_current_context()
+
+        def _answer(name, current):
+            """Prefer the file's answer unless the flag was given explicitly."""
+            if name in answers and ctx.get_parameter_source(name) != click.core.ParameterSource.COMMANDLINE:
+                return answers[name]
+            return current
+
+        preset = _answer("preset", preset)
+        host_count = int(_answer("host_count", host_count))
+        template = _answer("template", template)
+        format = _answer("format", format)
+        rollout = bool(_answer("rollout", rollout))
+        hosts = _answer("hosts", hosts)
+        rollout_mode = _answer("rollout_mode", rollout_mode)
+        output = _answer("output", output)
+
     # Default preset if not specified
     preset_id = preset or "java_heavy"
     
@@ -100,8 +224,7 @@ def wizard(preset: Optional[str], host_count: int, template: str, format: str, r
     
     # Load preset
     try:
-        loader = PresetLoader()
-        p = loader.load(preset_id)
+        p = shared_loader().load(preset_id)
         click.echo(f"Loaded preset {p.id} (sha256: {p.sha256[:8]}...)")
     except Exception as e:
         click.echo(f"Error loading preset: {e}", err=True)
@@ -109,7 +232,7 @@ def wizard(preset: Optional[str], host_count: int, template: str, format: str, r
     
     # Render template
     try:
-        renderer = TemplateRenderer()
+        renderer = shared_renderer()
         render_req = RenderRequest(
             template_id=template,
             tokens=TokensInfra(
@@ -150,8 +273,8 @@ def wizard(preset: Optional[str], host_count: int, template: str, format: str, r
     
     # Show output based on format
     if format == "json":
-        import json
-        output = {
+        from zcp_core.compat import json_dumps_pretty
+        payload = {
             "preset": p.dict(),
             "template": {
                 "id": template,
@@ -159,12 +282,19 @@ def wizard(preset: Optional[str], host_count: int, template: str, format: str, r
             },
             "estimate": estimate.dict()
         }
-        click.echo(json.dumps(output, indent=2))
+        click.echo(json_dumps_pretty(payload))
     else:
-        click.echo("\nGenerated configuration:")
-        click.echo("-------------------------")
-        click.echo(result.text)
-    
+        click.echo("\n".join(["\nGenerated configuration:", "-------------------------", result.text]))
+
+    # Write the rendered configuration if requested
+    if output:
+        try:
+            _atomic_write_text(output, result.text)
+            click.echo(f"Configuration written to {output}")
+        except OSError as e:
+            click.echo(f"Error writing configuration: {e}", err=True)
+            sys.exit(1)
+
     # Perform rollout if requested
     if rollout:
         from zcp_rollout.models import RolloutJob
@@ -194,18 +324,25 @@ def wizard(preset: Optional[str], host_count: int, template: str, format: str, r
         try:
             click.echo(f"Starting rollout with mode: {rollout_mode}")
             report = orchestrator.execute(job, mode=rollout_mode)
-            
-            # Display results
-            click.echo("\nRollout complete:")
-            click.echo(f"Success: {report.success} hosts ({report.success_rate:.1%})")
-            click.echo(f"Failed: {report.fail} hosts")
-            click.echo(f"Duration: {report.duration_s:.2f} seconds")
-            
+
+            # Display results with one buffered write instead of a
+            # stdout flush per line
+            lines = [
+                "\nRollout complete:",
+                f"Success: {report.success} hosts ({report.success_rate:.1%})",
+                f"Failed: {report.fail} hosts",
+                f"Duration: {report.duration_s:.2f} seconds",
+            ]
+
             if report.fail > 0:
-                click.echo("\nFailed hosts:")
-                for hostname, result in report.results.items():
-                    if not result.success:
-                        click.echo(f"  {hostname}: {result.message}")
+                lines.append("\nFailed hosts:")
+                # host_result, not result: the loop variable was
+                # clobbering the rendered template bound earlier in
+                # this function
+                for hostname, host_result in report.results.items():
+                    if not host_result.success:
+                        lines.append(f"  {hostname}: {host_result.message}")
+            click.echo("\n".join(lines))
         except Exception as e:
             click.echo(f"Error during rollout: {e}", err=True)
             sys.exit(1)
@@ -241,13 +378,13 @@ def lint():
 @click.option("--format", "-f", type=click.Choice(["text", "json"]), default="text")
 def lint_check(file: str, rules: Optional[str], format: str):
     """Lint a configuration file for issues."""
-    from zcp_lint.linter import Linter
+    from zcp_core.compat import json_dumps_pretty
+    from zcp_lint.linter import default_linter
     from zcp_lint.models import LintRequest
-    import json
-    
+
     # Read file
     try:
-        with open(file, "r") as f:
+        with open(file, "r", buffering=131072) as f:
             content = f.read()
     except Exception as e:
         click.echo(f"Error reading file: {e}", err=True)
@@ -265,40 +402,37 @@ def lint_check(file: str, rules: Optional[str], format: str):
         rules=rule_ids
     )
     
-    # Create linter and run
-    linter = Linter()
-    result = linter.lint(request)
+    # Run against the shared default linter
+    result = default_linter().lint(request)
     
     # Display results
     if format == "json":
-        click.echo(json.dumps(result.dict(), indent=2))
+        click.echo(json_dumps_pretty(result.dict()))
     else:
         click.echo(f"\nLint Results for {file}:")
         click.echo(f"Errors: {result.error_count}, Warnings: {result.warning_count}, Info: {result.info_count}")
         
         if result.has_findings:
-            click.echo("\nFindings:")
             # Sort by severity (error first, then warning, then info)
             sorted_findings = sorted(
-                result.findings, 
-                key=lambda f: {"error": 0, "warning": 1, "info": 2}.get(f.severity, 3)
+                result.findings,
+                key=lambda f: _SEVERITY_ORDER.get(f.severity, 3)
             )
-            
+
+            # Buffer the findings and emit them with a single write
+            lines = ["\nFindings:"]
             for finding in sorted_findings:
-                severity_icon = {
-                    "error": "✗",
-                    "warning": "⚠",
-                    "info": "ℹ"
-                }.get(finding.severity, "?")
-                
+                severity_icon = _SEVERITY_ICONS.get(finding.severity, "?")
+
                 location = ""
                 if finding.line is not None:
                     location = f" (line {finding.line}"
                     if finding.column is not None:
                         location += f", col {finding.column}"
                     location += ")"
-                
-                click.echo(f"  {severity_icon} [{finding.rule_id}]{location}: {finding.message}")
+
+                lines.append(f"  {severity_icon} [{finding.rule_id}]{location}: {finding.message}")
+            click.echo("\n".join(lines))
         else:
             click.echo("No issues found.")
     
@@ -311,29 +445,26 @@ def lint_check(file: str, rules: Optional[str], format: str):
 @click.option("--format", "-f", type=click.Choice(["text", "json"]), default="text")
 def lint_rules(format: str):
     """List available lint rules."""
+    from zcp_core.compat import json_dumps_pretty
     from zcp_lint.linter import Linter
-    import json
-    
+
     # Get rules
     rules = Linter.get_available_rules()
     
     # Display rules
     if format == "json":
-        click.echo(json.dumps([r.dict() for r in rules], indent=2))
+        click.echo(json_dumps_pretty([r.dict() for r in rules]))
     else:
-        click.echo("\nAvailable Lint Rules:")
-        
+        # Build all rows up front from the module-level icon table —
+        # previously the icon dict was reconstructed per rule and each
+        # rule cost two stdout flushes
+        lines = ["\nAvailable Lint Rules:"]
         for rule in rules:
-            severity_icon = {
-                "error": "✗",
-                "warning": "⚠",
-                "info": "ℹ"
-            }.get(rule.severity, "?")
-            
+            severity_icon = _SEVERITY_ICONS.get(rule.severity, "?")
             enabled = "enabled" if rule.enabled else "disabled"
-            
-            click.echo(f"  {severity_icon} {rule.id} - {rule.name} ({enabled})")
-            click.echo(f"      {rule.description}")
+            lines.append(f"  {severity_icon} {rule.id} - {rule.name} ({enabled})")
+            lines.append(f"      {rule.description}")
+        click.echo("\n".join(lines))
 
 
 @cli.group()
@@ -406,30 +537,21 @@ def logging_test(level: str):
 @click.option("--format", "-f", type=click.Choice(["text", "json"]), default="text")
 def validate_check(hosts: str, expected: float, confidence: float, threshold: float, timeframe: int, format: str):
     """Validate configuration by comparing expected vs. actual ingest."""
+    from zcp_core.compat import json_dumps_pretty
     from zcp_logging.logger import LoggerFactory
     from zcp_validate.models import ValidationJob
     from zcp_validate.validator import Validator
-    import json
-    
+
     logger = LoggerFactory.get("zcp_cli.validate")
     
     # Get host list
-    host_list = []
-    if hosts.startswith("@"):
-        # Read hosts from file
-        host_file = hosts[1:]
-        try:
-            with open(host_file, "r") as f:
-                host_list = [line.strip() for line in f if line.strip()]
-            logger.debug(f"Read {len(host_list)} hosts from file {host_file}")
-        except Exception as e:
-            logger.error(f"Error reading host file: {e}", context={"file": host_file})
-            click.echo(f"Error reading host file: {e}", err=True)
-            sys.exit(1)
-    else:
-        # Parse comma-separated list
-        host_list = [h.strip() for h in hosts.split(",")]
-        logger.debug(f"Parsed {len(host_list)} hosts from command line")
+    try:
+        host_list = _read_host_list(hosts)
+        logger.debug(f"Parsed {len(host_list)} hosts from {hosts[1:] if hosts.startswith('@') else 'command line'}")
+    except Exception as e:
+        logger.error(f"Error reading host file: {e}", context={"file": hosts[1:]})
+        click.echo(f"Error reading host file: {e}", err=True)
+        sys.exit(1)
     
     click.echo(f"Validating {len(host_list)} hosts...")
     logger.info(f"Starting validation for {len(host_list)} hosts", 
@@ -461,17 +583,22 @@ def validate_check(hosts: str, expected: float, confidence: float, threshold: fl
             
             # Display results
             if format == "json":
-                click.echo(json.dumps(result.dict(), indent=2, default=str))
+                click.echo(json_dumps_pretty(result.dict()))
             else:
-                click.echo(f"\nValidation Result: {result.summary}")
-                click.echo(f"Query Duration: {result.query_duration_ms:.2f} ms")
-                click.echo("\nHost Details:")
-                
-                # Sort by hostname
-                for hostname in sorted(result.host_results.keys()):
-                    host_result = result.host_results[hostname]
+                # Buffer the report and emit it with a single write instead
+                # of one flush per host
+                lines = [
+                    f"\nValidation Result: {result.summary}",
+                    f"Query Duration: {result.query_duration_ms:.2f} ms",
+                    "\nHost Details:",
+                ]
+
+                # Sort by hostname; iterating items() avoids a second
+                # dict lookup per host
+                for hostname, host_result in sorted(result.host_results.items()):
                     icon = "✓" if host_result.within_threshold else "✗"
-                    click.echo(f"  {icon} {hostname}: {host_result.actual_gib_day:.2f} GiB/day (expected: {host_result.expected_gib_day:.2f}, deviation: {host_result.deviation_percent:.1f}%)")
+                    lines.append(f"  {icon} {hostname}: {host_result.actual_gib_day:.2f} GiB/day (expected: {host_result.expected_gib_day:.2f}, deviation: {host_result.deviation_percent:.1f}%)")
+                click.echo("\n".join(lines))
             
             # Exit with error code if validation failed
             if not result.overall_pass:
@@ -503,7 +630,7 @@ def execute_rollout(hosts: str, config: str, target: str, filename: str, paralle
     
     # Read configuration file
     try:
-        with open(config, "r") as f:
+        with open(config, "r", buffering=131072) as f:
             config_content = f.read()
             
         # Calculate checksum
@@ -519,19 +646,11 @@ def execute_rollout(hosts: str, config: str, target: str, filename: str, paralle
         sys.exit(1)
     
     # Get host list
-    host_list = []
-    if hosts.startswith("@"):
-        # Read hosts from file
-        host_file = hosts[1:]
-        try:
-            with open(host_file, "r") as f:
-                host_list = [line.strip() for line in f if line.strip()]
-        except Exception as e:
-            click.echo(f"Error reading host file: {e}", err=True)
-            sys.exit(1)
-    else:
-        # Parse comma-separated list
-        host_list = [h.strip() for h in hosts.split(",")]
+    try:
+        host_list = _read_host_list(hosts)
+    except Exception as e:
+        click.echo(f"Error reading host file: {e}", err=True)
+        sys.exit(1)
     
     click.echo(f"Target hosts: {len(host_list)} hosts")
     
@@ -585,33 +704,34 @@ def execute_rollout(hosts: str, config: str, target: str, filename: str, paralle
 @click.option("--output", "-o", help="Output file for events")
 def bus_trace(output: Optional[str]):
     """Trace event bus activity."""
-    import os
     import json
-    import time
-    from zcp_core.bus import Event, Subscriber, subscribe
-    
-    # Set bus mode to trace
-    os.environ["ZCP_BUS"] = BusMode.TRACE
-    os.environ["ZCP_TRACE_PATH"] = output or "zcp_events.jsonl"
-    
+    import threading
+    from zcp_core.bus import BusMode, Event, Subscriber, bus_mode, subscribe
+
     class EventTracer:
-        topic = ".*"  # Match all topics
-        
+        topic = "*"  # Match all topics
+
         async def handle(self, event: Event):
             """Print events to console."""
             click.echo(f"{event.ts.isoformat()} | {event.topic} | {json.dumps(event.payload)}")
-    
-    # Subscribe to all events
-    subscribe(EventTracer())
-    
-    click.echo(f"Tracing events to {os.environ['ZCP_TRACE_PATH']}")
-    click.echo("Press Ctrl+C to stop...")
-    
-    try:
-        while True:
-            time.sleep(0.1)
-    except KeyboardInterrupt:
-        click.echo("Trace stopped")
+
+    trace_path = output or "zcp_events.jsonl"
+
+    # Set bus mode to trace for the lifetime of the command, restoring
+    # the environment on exit
+    with bus_mode(BusMode.TRACE, trace_path):
+        # Subscribe to all events
+        subscribe(EventTracer())
+
+        click.echo(f"Tracing events to {trace_path}")
+        click.echo("Press Ctrl+C to stop...")
+
+        try:
+            # Block until interrupted instead of waking 10 times a second
+            # in a sleep poll loop
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            click.echo("Trace stopped")
 
 
 if __name__ == "__main__":
@@ -8,16 +8,28 @@ needed for the core workflow: preset → template → lint → cost → rollout
 import os
 import sys
 import logging
-from typing import List, Optional
+from typing import Optional
 
 import click
-import yaml
 
 # Configure basic logging
-logging.basicConfig(level=logging.INFO, 
+logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("zcp")
 
+# Configuration template for the wizard, defined once at module scope so
+# each run pays a single format pass instead of rebuilding the literal.
+_CONFIG_TEMPLATE = """
+integrations:
+  - name: nri-process-discovery
+    config:
+      interval: {sample_rate}
+      discovery:
+        mode: {filter_mode}
+        match_patterns:
+{match_patterns}
+"""
+
 @click.group()
 @click.version_option(version="0.1.0")
 def cli():
@@ -42,15 +54,14 @@ def wizard(preset: str, host_count: int, hosts: Optional[str], rollout: bool, va
     5. Optionally roll out to hosts
     6. Optionally validate the rollout
     """
-    from zcp_preset.loader import PresetLoader
+    from zcp_preset.loader import shared_loader
     from zcp_cost.simple_cost import estimate_cost, CostRequest
     from zcp_lint.simple_lint import lint_config
-    
+
     # 1. Load preset
     click.echo(f"Loading preset: {preset}")
     try:
-        loader = PresetLoader()
-        p = loader.load(preset)
+        p = shared_loader().load(preset)
         click.echo(f"Loaded preset: {p.id}")
     except Exception as e:
         click.echo(f"Error loading preset: {e}", err=True)
@@ -60,16 +71,7 @@ def wizard(preset: str, host_count: int, hosts: Optional[str], rollout: bool, va
     click.echo("Rendering configuration template...")
     try:
         # Use simpler string template approach
-        template_content = """
-integrations:
-  - name: nri-process-discovery
-    config:
-      interval: {sample_rate}
-      discovery:
-        mode: {filter_mode}
-        match_patterns:
-{match_patterns}
-""".format(
+        template_content = _CONFIG_TEMPLATE.format(
             sample_rate=p.default_sample_rate,
             filter_mode=p.filter_mode,
             match_patterns="\n".join([f"          - {pattern}" for pattern in p.tier1_patterns])
@@ -88,16 +90,20 @@ integrations:
     try:
         lint_result = lint_config(template_content)
         if lint_result.has_errors:
-            click.echo(f"Linting found {lint_result.error_count} errors:")
-            for finding in lint_result.findings:
-                if finding.severity == "error":
-                    click.echo(f"  ERROR: {finding.message}")
+            # Buffer findings into a single write rather than one flush
+            # per finding
+            lines = [f"Linting found {lint_result.error_count} errors:"]
+            lines.extend(f"  ERROR: {finding.message}"
+                         for finding in lint_result.findings
+                         if finding.severity == "error")
+            click.echo("\n".join(lines))
             sys.exit(1)
         elif lint_result.warning_count > 0:
-            click.echo(f"Linting found {lint_result.warning_count} warnings:")
-            for finding in lint_result.findings:
-                if finding.severity == "warning":
-                    click.echo(f"  WARNING: {finding.message}")
+            lines = [f"Linting found {lint_result.warning_count} warnings:"]
+            lines.extend(f"  WARNING: {finding.message}"
+                         for finding in lint_result.findings
+                         if finding.severity == "warning")
+            click.echo("\n".join(lines))
         else:
             click.echo("Linting passed with no issues!")
     except Exception as e:
@@ -116,16 +122,16 @@ integrations:
         )
         estimate = estimate_cost(cost_req)
         
-        click.echo(f"Estimated data ingest: {estimate.gib_per_day:.2f} GiB/day")
-        click.echo(f"Description: {estimate.description}")
+        click.echo(f"Estimated data ingest: {estimate.gib_per_day:.2f} GiB/day\n"
+                   f"Description: {estimate.description}")
     except Exception as e:
         click.echo(f"Error estimating cost: {e}", err=True)
         sys.exit(1)
-    
-    # Show the generated configuration
-    click.echo("\nGenerated configuration:")
-    click.echo("-------------------------")
-    click.echo(template_content)
+
+    # Show the generated configuration in one write
+    click.echo("\nGenerated configuration:\n"
+               "-------------------------\n"
+               f"{template_content}")
     
     # 5. Perform rollout if requested
     if rollout:
@@ -146,13 +152,14 @@ integrations:
         try:
             summary = rollout_config(target_hosts, template_content, "infra_process.yaml", dry_run=True)
             
-            # Display results
-            click.echo(f"\nRollout summary: {summary.success}/{summary.total} hosts successful ({summary.success_rate:.1f}%)")
+            # Display results with a single buffered write
+            lines = [f"\nRollout summary: {summary.success}/{summary.total} hosts successful ({summary.success_rate:.1f}%)"]
             if summary.failure > 0:
-                click.echo("\nFailed hosts:")
-                for hostname, result in summary.results.items():
-                    if not result.success:
-                        click.echo(f"  {hostname}: {result.message}")
+                lines.append("\nFailed hosts:")
+                lines.extend(f"  {hostname}: {result.message}"
+                             for hostname, result in summary.results.items()
+                             if not result.success)
+            click.echo("\n".join(lines))
         except Exception as e:
             click.echo(f"Error during rollout: {e}", err=True)
             sys.exit(1)
@@ -174,12 +181,12 @@ integrations:
                     threshold=0.2  # Allow 20% deviation
                 )
                 
-                # Display results
-                click.echo(f"\nValidation summary: {summary.pass_count}/{summary.hosts_validated} hosts passed ({summary.pass_rate:.1f}%)")
-                
+                # Display results with a single buffered write
+                lines = [f"\nValidation summary: {summary.pass_count}/{summary.hosts_validated} hosts passed ({summary.pass_rate:.1f}%)"]
                 for hostname, result in summary.results.items():
                     status = "PASS" if result.within_threshold else "FAIL"
-                    click.echo(f"  {hostname}: {status} - {result.actual_gib_day:.2f} GiB/day (expected: {result.expected_gib_day:.2f})")
+                    lines.append(f"  {hostname}: {status} - {result.actual_gib_day:.2f} GiB/day (expected: {result.expected_gib_day:.2f})")
+                click.echo("\n".join(lines))
             except Exception as e:
                 click.echo(f"Error during validation: {e}", err=True)
                 sys.exit(1)
@@ -194,7 +201,7 @@ def lint(file: str):
     
     # Read file
     try:
-        with open(file, "r") as f:
+        with open(file, "r", buffering=131072) as f:
             content = f.read()
     except Exception as e:
         click.echo(f"Error reading file: {e}", err=True)
@@ -203,18 +210,20 @@ def lint(file: str):
     # Lint the file
     result = lint_config(content)
     
-    # Display results
-    click.echo(f"\nLint Results for {file}:")
-    click.echo(f"Errors: {result.error_count}, Warnings: {result.warning_count}")
-    
+    # Display results with a single buffered write rather than one
+    # flush per finding
+    lines = [f"\nLint Results for {file}:",
+             f"Errors: {result.error_count}, Warnings: {result.warning_count}"]
+
     if result.findings:
-        click.echo("\nFindings:")
+        lines.append("\nFindings:")
         for finding in result.findings:
             level = finding.severity.upper()
             location = f" (line {finding.line})" if finding.line is not None else ""
-            click.echo(f"  {level}: {finding.message}{location}")
+            lines.append(f"  {level}: {finding.message}{location}")
     else:
-        click.echo("No issues found!")
+        lines.append("No issues found!")
+    click.echo("\n".join(lines))
     
     # Exit with error code if there are errors
     if result.error_count > 0:
@@ -230,7 +239,7 @@ def rollout(hosts: str, config: str, dry_run: bool):
     
     # Read configuration file
     try:
-        with open(config, "r") as f:
+        with open(config, "r", buffering=131072) as f:
             content = f.read()
     except Exception as e:
         click.echo(f"Error reading configuration file: {e}", err=True)
@@ -255,15 +264,16 @@ def rollout(hosts: str, config: str, dry_run: bool):
             dry_run=dry_run
         )
         
-        # Display results
-        click.echo(f"\nRollout complete: {summary.success}/{summary.total} hosts successful ({summary.success_rate:.1f}%)")
-        click.echo(f"Duration: {summary.duration_ms/1000:.2f} seconds")
-        
+        # Display results with a single buffered write
+        lines = [f"\nRollout complete: {summary.success}/{summary.total} hosts successful ({summary.success_rate:.1f}%)",
+                 f"Duration: {summary.duration_ms/1000:.2f} seconds"]
+
         if summary.failure > 0:
-            click.echo("\nFailed hosts:")
-            for hostname, result in summary.results.items():
-                if not result.success:
-                    click.echo(f"  {hostname}: {result.message}")
+            lines.append("\nFailed hosts:")
+            lines.extend(f"  {hostname}: {result.message}"
+                         for hostname, result in summary.results.items()
+                         if not result.success)
+        click.echo("\n".join(lines))
     except Exception as e:
         click.echo(f"Error during rollout: {e}", err=True)
         sys.exit(1)
@@ -293,12 +303,14 @@ def validate(hosts: str, expected: float, threshold: float):
             threshold=threshold
         )
         
-        # Display results
-        click.echo(f"\nValidation complete: {summary.pass_count}/{summary.hosts_validated} hosts passed ({summary.pass_rate:.1f}%)")
-        
+        # Display results with a single buffered write rather than one
+        # flush per host
+        lines = [f"\nValidation complete: {summary.pass_count}/{summary.hosts_validated} hosts passed ({summary.pass_rate:.1f}%)"]
+
         for hostname, result in summary.results.items():
             status = "✓" if result.within_threshold else "✗"
-            click.echo(f"  {status} {hostname}: {result.actual_gib_day:.2f} GiB/day (expected: {result.expected_gib_day:.2f}, deviation: {result.deviation_percent:.1f}%)")
+            lines.append(f"  {status} {hostname}: {result.actual_gib_day:.2f} GiB/day (expected: {result.expected_gib_day:.2f}, deviation: {result.deviation_percent:.1f}%)")
+        click.echo("\n".join(lines))
         
         # Exit with error code if validation failed
         if summary.fail_count > 0:
@@ -8,19 +8,19 @@ Provides a publish-subscribe mechanism with pluggable backends:
 """
 
 import asyncio
-import json
 import logging
 import os
-import re
 import time
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Pattern, Protocol, Set, Union
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Pattern, Protocol, Set, Tuple, Union
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
 
-from zcp_core.compat import get_or_create_loop
+from zcp_core.compat import get_or_create_loop, json_dumps_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +42,98 @@ class Subscriber(Protocol):
         """Handle an incoming event."""
         ...
 
+def _compile_topic_matcher(topic: Union[str, Pattern[str]]):
+    """
+    Compile a subscription topic into a match predicate.
+
+    Doing this once at subscribe time means publish loops call a single
+    prebuilt predicate per subscriber instead of re-deriving the
+    wildcard prefix (topic[:-1]) and re-checking the topic kind for
+    every event.
+    """
+    if isinstance(topic, Pattern):
+        return topic.match
+    if topic.endswith('*'):
+        prefix = topic[:-1]
+        return lambda event_topic: event_topic.startswith(prefix)
+    return topic.__eq__
+
+
+class _SubscriberIndex:
+    """
+    Dispatch index over a backend's subscribers.
+
+    Plain-string subscriptions — the common case — are bucketed by topic
+    in a dict, so publishing resolves them with one hash lookup instead
+    of running every subscriber's match predicate. Prefix wildcards
+    ("rollout.*") are bucketed by their prefix and matched by walking
+    the event topic's prefixes, so their cost scales with the topic
+    length rather than the subscriber count. Only regex subscriptions
+    stay on a scan list with their compiled predicates.
+    """
+
+    __slots__ = ("_exact", "_prefix", "_scan")
+
+    def __init__(self):
+        self._exact: Dict[str, List[Subscriber]] = {}
+        self._prefix: Dict[str, List[Subscriber]] = {}
+        self._scan: List[Tuple[Subscriber, Callable]] = []
+
+    def __bool__(self) -> bool:
+        return bool(self._exact or self._prefix or self._scan)
+
+    def add(self, handler: Subscriber) -> None:
+        """Register a subscriber under its topic."""
+        topic = handler.topic
+        if not isinstance(topic, str):
+            self._scan.append((handler, _compile_topic_matcher(topic)))
+        elif topic.endswith('*'):
+            self._prefix.setdefault(topic[:-1], []).append(handler)
+        else:
+            self._exact.setdefault(topic, []).append(handler)
+
+    @staticmethod
+    def _discard_from(buckets: Dict[str, List[Subscriber]], handler: Subscriber) -> None:
+        """Remove a subscriber from a bucket dict, dropping empty buckets."""
+        for key, subs in list(buckets.items()):
+            for i, sub in enumerate(subs):
+                if sub is handler:
+                    del subs[i]
+                    break
+            if not subs:
+                # Drop the empty bucket so __bool__ stays accurate
+                del buckets[key]
+
+    def discard(self, handler: Subscriber) -> None:
+        """Remove a subscriber (no-op if not registered)."""
+        self._discard_from(self._exact, handler)
+        self._discard_from(self._prefix, handler)
+        self._scan = [entry for entry in self._scan if entry[0] is not handler]
+
+    def __contains__(self, handler: Subscriber) -> bool:
+        return (any(sub is handler for subs in self._exact.values() for sub in subs)
+                or any(sub is handler for subs in self._prefix.values() for sub in subs)
+                or any(entry[0] is handler for entry in self._scan))
+
+    def matching(self, event_topic: str) -> Iterator[Subscriber]:
+        """Yield subscribers whose topic matches the event topic."""
+        yield from self._exact.get(event_topic, ())
+        if self._prefix:
+            # Every matching prefix is by definition a prefix of the
+            # event topic, so check each leading slice of the topic
+            # against the buckets instead of testing every wildcard
+            # subscriber — the same trade an automaton makes, without a
+            # dependency for the handful of dotted topic strings here
+            prefix_buckets = self._prefix
+            for end in range(len(event_topic) + 1):
+                subs = prefix_buckets.get(event_topic[:end])
+                if subs:
+                    yield from subs
+        for sub, matches in self._scan:
+            if matches(event_topic):
+                yield sub
+
+
 class BusBackend(Protocol):
     """Protocol for event bus backends."""
     
@@ -65,35 +157,31 @@ class SyncMemBackend:
     """In-memory synchronous event delivery."""
     
     def __init__(self):
-        self._subscribers: List[Subscriber] = []
-        self._loop = get_or_create_loop()
-    
+        self._subscribers = _SubscriberIndex()
+
     async def publish(self, event: Event) -> None:
         """Publish event to all matching subscribers synchronously."""
-        tasks = []
-        
-        for sub in self._subscribers:
-            if isinstance(sub.topic, str):
-                if sub.topic == event.topic or sub.topic.endswith('*') and event.topic.startswith(sub.topic[:-1]):
-                    task = self._loop.create_task(sub.handle(event))
-                    tasks.append(task)
-            elif isinstance(sub.topic, Pattern) and sub.topic.match(event.topic):
-                task = self._loop.create_task(sub.handle(event))
-                tasks.append(task)
-                
-        # Await all tasks to ensure they complete
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
-    
+        # Gather the handler coroutines on whichever loop is driving this
+        # coroutine. Creating tasks on a loop captured at construction
+        # breaks when publish_sync runs the publish on a fresh loop
+        # ("got Future attached to a different loop").
+        coros = [
+            sub.handle(event)
+            for sub in self._subscribers.matching(event.topic)
+        ]
+
+        # Await all handlers to ensure they complete
+        if coros:
+            await asyncio.gather(*coros, return_exceptions=True)
+
     def subscribe(self, handler: Subscriber) -> None:
         """Register a subscriber."""
-        self._subscribers.append(handler)
-        
+        self._subscribers.add(handler)
+
     def unsubscribe(self, handler: Subscriber) -> None:
         """Remove a subscriber."""
-        if handler in self._subscribers:
-            self._subscribers.remove(handler)
-    
+        self._subscribers.discard(handler)
+
     def shutdown(self) -> None:
         """Clean shutdown - no-op for sync backend."""
         pass
@@ -102,27 +190,21 @@ class AsyncQueueBackend:
     """Asynchronous delivery using asyncio.Queue."""
     
     def __init__(self, max_queue_size: int = 10):
-        self._subscribers: List[Subscriber] = []
+        self._subscribers = _SubscriberIndex()
         self._queues: Dict[Subscriber, asyncio.Queue] = {}
         self._max_queue_size = max_queue_size
         self._tasks: Set[asyncio.Task] = set()
         self._loop = get_or_create_loop()
-        
+
     def publish(self, event: Event) -> None:
         """Queue event for asynchronous delivery."""
-        for sub in self._subscribers:
-            if isinstance(sub.topic, str):
-                if sub.topic == event.topic or sub.topic.endswith('*') and event.topic.startswith(sub.topic[:-1]):
-                    try:
-                        self._ensure_queue(sub).put_nowait(event)
-                    except asyncio.QueueFull:
-                        logger.error(f"Queue full for subscriber handling {event.topic} - event dropped")
-            elif isinstance(sub.topic, Pattern) and sub.topic.match(event.topic):
-                try:
-                    self._ensure_queue(sub).put_nowait(event)
-                except asyncio.QueueFull:
-                    logger.error(f"Queue full for subscriber handling {event.topic} - event dropped")
-                
+        for sub in self._subscribers.matching(event.topic):
+            try:
+                self._ensure_queue(sub).put_nowait(event)
+            except asyncio.QueueFull:
+                logger.error(f"Queue full for subscriber handling {event.topic} - event dropped")
+
+
     def _ensure_queue(self, sub: Subscriber) -> asyncio.Queue:
         """Create queue for subscriber if it doesn't exist."""
         if sub not in self._queues:
@@ -146,13 +228,13 @@ class AsyncQueueBackend:
     
     def subscribe(self, handler: Subscriber) -> None:
         """Register a subscriber."""
-        self._subscribers.append(handler)
-    
+        self._subscribers.add(handler)
+
     def unsubscribe(self, handler: Subscriber) -> None:
         """Remove a subscriber and clean up its queue."""
         if handler in self._subscribers:
-            self._subscribers.remove(handler)
-            
+            self._subscribers.discard(handler)
+
             # Clean up the queue if it exists
             if handler in self._queues:
                 # Find the task processing this queue
@@ -174,47 +256,63 @@ class FileTraceBackend:
     
     def __init__(self, path: Optional[str] = None):
         self._path = path or os.environ.get("ZCP_TRACE_PATH", "zcp_events.jsonl")
-        self._subscribers: List[Subscriber] = []
-        self._loop = get_or_create_loop()
-        
+        self._subscribers = _SubscriberIndex()
+        # Opened lazily on first publish and kept open; reopening the
+        # trace file per event costs an open/close syscall pair each time
+        self._file = None
+
+    def _trace_file(self):
+        """Get the open trace file handle, opening it on first use."""
+        if self._file is None:
+            # Ensure the parent directory in one exist_ok call — no
+            # pre-check stat, and only ever done once since the handle
+            # is cached for the life of the backend
+            parent = Path(self._path).parent
+            if parent != Path("."):
+                parent.mkdir(parents=True, exist_ok=True)
+            # Binary mode: events are serialized straight to bytes, so
+            # there is no text-layer encode on each write
+            self._file = open(self._path, "ab")
+        return self._file
+
     async def publish(self, event: Event) -> None:
         """Log event to file and deliver to subscribers."""
-        # Write to trace file
-        with open(self._path, "a") as f:
-            f.write(json.dumps({
-                "event_id": str(event.event_id),
-                "ts": event.ts.isoformat(),
-                "topic": event.topic,
-                "payload": event.payload
-            }) + "\n")
-            
-        # Also deliver to subscribers for live processing
-        tasks = []
-        for sub in self._subscribers:
-            if isinstance(sub.topic, str):
-                if sub.topic == event.topic or sub.topic.endswith('*') and event.topic.startswith(sub.topic[:-1]):
-                    task = self._loop.create_task(sub.handle(event))
-                    tasks.append(task)
-            elif isinstance(sub.topic, Pattern) and sub.topic.match(event.topic):
-                task = self._loop.create_task(sub.handle(event))
-                tasks.append(task)
-                
-        # Await all tasks to ensure they complete
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
-    
+        # Write to trace file; flush so the trace stays readable while
+        # the process is still running
+        f = self._trace_file()
+        f.write(json_dumps_bytes({
+            "event_id": str(event.event_id),
+            "ts": event.ts.isoformat(),
+            "topic": event.topic,
+            "payload": event.payload
+        }) + b"\n")
+        f.flush()
+
+
+        # Also deliver to subscribers for live processing, gathered on
+        # the driving loop for the same reason as SyncMemBackend.publish
+        coros = [
+            sub.handle(event)
+            for sub in self._subscribers.matching(event.topic)
+        ]
+
+        # Await all handlers to ensure they complete
+        if coros:
+            await asyncio.gather(*coros, return_exceptions=True)
+
     def subscribe(self, handler: Subscriber) -> None:
         """Register a subscriber."""
-        self._subscribers.append(handler)
-        
+        self._subscribers.add(handler)
+
     def unsubscribe(self, handler: Subscriber) -> None:
         """Remove a subscriber."""
-        if handler in self._subscribers:
-            self._subscribers.remove(handler)
-        
+        self._subscribers.discard(handler)
+
     def shutdown(self) -> None:
-        """Clean shutdown - no-op for file backend."""
-        pass
+        """Clean shutdown - close the trace file handle."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
 
 class BusMode(str, Enum):
     """Available bus operation modes."""
@@ -222,12 +320,15 @@ class BusMode(str, Enum):
     ASYNC = "async"
     TRACE = "trace"
 
-# Global bus instance
+# Global bus instance. Whether its publish method is a coroutine is
+# determined once at creation; probing asyncio.iscoroutinefunction on
+# every publish showed up as avoidable per-event overhead.
 _backend: Optional[BusBackend] = None
+_backend_publish_async: bool = False
 
 def _get_backend() -> BusBackend:
     """Get or initialize the bus backend."""
-    global _backend
+    global _backend, _backend_publish_async
     if _backend is None:
         mode = os.environ.get("ZCP_BUS", BusMode.SYNC)
         if mode == BusMode.ASYNC:
@@ -236,13 +337,17 @@ def _get_backend() -> BusBackend:
             _backend = FileTraceBackend()
         else:
             _backend = SyncMemBackend()
+        _backend_publish_async = asyncio.iscoroutinefunction(_backend.publish)
     return _backend
 
 async def publish(event: Event) -> None:
     """Publish an event to the bus."""
     backend = _get_backend()
-    # Check if the backend's publish method is a coroutine function
-    if asyncio.iscoroutinefunction(backend.publish):
+    # Fast path: with the in-memory backend and no subscribers there is
+    # nothing to deliver, so skip the dispatch machinery entirely
+    if isinstance(backend, SyncMemBackend) and not backend._subscribers:
+        return
+    if _backend_publish_async:
         await backend.publish(event)
     else:
         backend.publish(event)
@@ -253,7 +358,11 @@ def publish_sync(event: Event) -> None:
     Use this in synchronous code contexts where awaiting is not possible.
     """
     backend = _get_backend()
-    if asyncio.iscoroutinefunction(backend.publish):
+    # Fast path: with the in-memory backend and no subscribers there is
+    # nothing to deliver, so skip the event-loop machinery entirely
+    if isinstance(backend, SyncMemBackend) and not backend._subscribers:
+        return
+    if _backend_publish_async:
         # Create a new event loop if needed
         try:
             loop = asyncio.get_running_loop()
@@ -286,3 +395,30 @@ def shutdown() -> None:
     if _backend is not None:
         _backend.shutdown()
         _backend = None
+
+@contextmanager
+def bus_mode(mode: BusMode, trace_path: Optional[str] = None) -> Iterator[None]:
+    """
+    Temporarily override the bus mode for the duration of a block.
+
+    Snapshots and restores the relevant environment variables instead of
+    leaving callers to mutate os.environ by hand and remember to undo it.
+    Must be entered before the backend is first used, since the mode is
+    read once when the backend is created.
+
+    Args:
+        mode: Bus mode to apply inside the block
+        trace_path: Output path for trace mode (optional)
+    """
+    snapshot = {key: os.environ.get(key) for key in ("ZCP_BUS", "ZCP_TRACE_PATH")}
+    os.environ["ZCP_BUS"] = mode
+    if trace_path is not None:
+        os.environ["ZCP_TRACE_PATH"] = trace_path
+    try:
+        yield
+    finally:
+        for key, value in snapshot.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
@@ -4,8 +4,7 @@ Compatibility module for handling differences between Python versions and librar
 
 import asyncio
 import sys
-import importlib.util
-from typing import Any, Callable, Dict, Optional, Type, TypeVar, cast
+from typing import Any, Callable, Dict, Type, TypeVar, cast
 
 # Async compatibility for Python 3.11+
 def get_or_create_loop() -> asyncio.AbstractEventLoop:
@@ -34,6 +33,101 @@ def get_or_create_loop() -> asyncio.AbstractEventLoop:
             # In Python <= 3.10, get_event_loop() still works
             return asyncio.get_event_loop()
 
+# JSON compatibility: prefer orjson (C implementation, ~3-5x faster on
+# large payloads) when it is installed, falling back to stdlib json.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+import json as _json
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to JSON bytes using the fastest available encoder.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return _json.dumps(obj).encode("utf-8")
+
+
+def json_dumps_pretty(obj: Any) -> str:
+    """
+    Serialize an object to indented JSON using the fastest available encoder.
+
+    Non-JSON-native values (datetimes, UUIDs, paths) are stringified, matching
+    json.dumps(default=str).
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON text indented with two spaces
+    """
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2, default=str).decode("utf-8")
+    return _json.dumps(obj, indent=2, default=str)
+
+
+def json_loads(data: Any) -> Any:
+    """
+    Parse JSON from str or bytes using the fastest available decoder.
+
+    Args:
+        data: JSON text or bytes
+
+    Returns:
+        Parsed object
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return _json.loads(data)
+
+
+# YAML compatibility: prefer the libyaml C loader/dumper (roughly an
+# order of magnitude faster) when PyYAML was built against it.
+import yaml as _yaml
+
+try:
+    from yaml import CSafeDumper as SafeYamlDumper, CSafeLoader as SafeYamlLoader
+except ImportError:
+    from yaml import SafeDumper as SafeYamlDumper, SafeLoader as SafeYamlLoader
+
+
+def yaml_safe_load(stream: Any) -> Any:
+    """
+    Parse YAML with the fastest available safe loader.
+
+    Args:
+        stream: YAML text, bytes or file object
+
+    Returns:
+        Parsed object
+    """
+    return _yaml.load(stream, Loader=SafeYamlLoader)
+
+
+def yaml_safe_dump(data: Any, **kwargs: Any) -> str:
+    """
+    Serialize to YAML with the fastest available safe dumper.
+
+    Args:
+        data: Object to serialize
+        **kwargs: Extra arguments passed to yaml.dump
+
+    Returns:
+        YAML text
+    """
+    return _yaml.dump(data, Dumper=SafeYamlDumper, **kwargs)
+
+
 # Pydantic compatibility
 def is_pydantic_v2() -> bool:
     """Check if Pydantic v2 is installed."""
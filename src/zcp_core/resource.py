@@ -99,7 +99,7 @@ def list_resources(package_name: str, resource_dir: str) -> list[str]:
                     resources.append(item.name)
         if resources:
             return resources
-    except (ImportError, ModuleNotFoundError, AttributeError, FileNotFoundError):
+    except (ImportError, ModuleNotFoundError, AttributeError, FileNotFoundError, TypeError):
         pass
         
     # Try direct file path for development mode
@@ -108,8 +108,11 @@ def list_resources(package_name: str, resource_dir: str) -> list[str]:
         package_path = Path(package_module.__file__).parent
         resource_path = package_path / resource_dir
         
-        if resource_path.exists() and resource_path.is_dir():
-            return [item.name for item in resource_path.iterdir() if item.is_file()]
+        if resource_path.is_dir():
+            # os.scandir reuses file-type info from the directory read
+            # itself; iterdir + is_file() would stat every entry
+            with os.scandir(resource_path) as entries:
+                return [entry.name for entry in entries if entry.is_file()]
     except (ImportError, AttributeError, TypeError):
         pass
         
@@ -4,7 +4,7 @@ Schema validation module for ZCP component contracts.
 Handles JSON Schema validation against registered schemas in the schema registry.
 """
 
-import json
+import functools
 import os
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
@@ -12,11 +12,14 @@ from typing import Any, Dict, Optional, Union
 import jsonschema
 from jsonschema import ValidationError
 
+from zcp_core.compat import json_loads
+
 # Default schema directory
 SCHEMA_DIR = os.environ.get("ZCP_SCHEMA_DIR", None)
 
+@functools.lru_cache(maxsize=1)
 def _find_schema_dir() -> Path:
-    """Find the schema directory."""
+    """Find the schema directory (detected once per process)."""
     if SCHEMA_DIR:
         return Path(SCHEMA_DIR)
     
@@ -30,46 +33,79 @@ def _find_schema_dir() -> Path:
     # Default to current working directory
     return Path.cwd() / "schema"
 
+@functools.lru_cache(maxsize=32)
 def load_schema(schema_id: str, version: int = 1) -> Dict[str, Any]:
     """
     Load a JSON schema from the schema registry.
-    
+
+    Schemas are static files, so results are memoized: every validate()
+    call was previously paying an open + json.load for the same schema.
+    Callers must treat the returned dictionary as read-only.
+
     Args:
         schema_id: The schema identifier (e.g., "CostEstimate")
         version: The schema version (default: 1)
-        
+
     Returns:
         The loaded schema as a dictionary
-        
+
     Raises:
         FileNotFoundError: If the schema cannot be found
-        json.JSONDecodeError: If the schema is not valid JSON
+        ValueError: If the schema is not valid JSON
     """
     schema_dir = _find_schema_dir()
     schema_path = schema_dir / f"v{version}" / f"{schema_id}.schema.json"
     
-    if not schema_path.exists():
-        raise FileNotFoundError(f"Schema not found: {schema_path}")
-    
-    with open(schema_path, "r") as f:
-        return json.load(f)
+    # Read raw bytes and decode through the compat helper (orjson when
+    # available) instead of stdlib json.load on a text-mode file. Going
+    # straight to open skips a stat() for the common case where the
+    # schema exists.
+    try:
+        raw = schema_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Schema not found: {schema_path}") from None
+    return json_loads(raw)
+
+@functools.lru_cache(maxsize=32)
+def _compiled_validator(schema_id: str, version: int) -> jsonschema.protocols.Validator:
+    """
+    Get a compiled validator for a schema (memoized).
+
+    jsonschema.validate() re-resolves the metaschema and rebuilds the
+    validator object on every call; compiling once per schema leaves
+    only the actual instance check on the hot path.
+
+    Args:
+        schema_id: The schema identifier (e.g., "CostEstimate")
+        version: The schema version
+
+    Returns:
+        A validator bound to the loaded schema
+    """
+    schema = load_schema(schema_id, version)
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
 
 def validate(obj: Any, schema_id: str, version: int = 1) -> None:
     """
     Validate an object against a JSON schema.
-    
+
     Args:
         obj: The object to validate
         schema_id: The schema identifier (e.g., "CostEstimate")
         version: The schema version (default: 1)
-        
+
     Raises:
         ValidationError: If the object does not conform to the schema
         FileNotFoundError: If the schema cannot be found
-        json.JSONDecodeError: If the schema is not valid JSON
+        ValueError: If the schema is not valid JSON
     """
-    schema = load_schema(schema_id, version)
-    jsonschema.validate(instance=obj, schema=schema)
+    error = jsonschema.exceptions.best_match(
+        _compiled_validator(schema_id, version).iter_errors(obj)
+    )
+    if error is not None:
+        raise error
 
 def is_valid(obj: Any, schema_id: str, version: int = 1) -> bool:
     """
@@ -86,5 +122,5 @@ def is_valid(obj: Any, schema_id: str, version: int = 1) -> bool:
     try:
         validate(obj, schema_id, version)
         return True
-    except (ValidationError, FileNotFoundError, json.JSONDecodeError):
+    except (ValidationError, FileNotFoundError, ValueError):
         return False
@@ -2,9 +2,14 @@
 Cost coordinator implementation.
 """
 
+import concurrent.futures
+from operator import attrgetter
 from typing import List
 
-from zcp_core.bus import Event, publish
+# publish_sync is bound to the local name publish: these modules run in
+# synchronous code, and the async publish() coroutine was being created
+# and dropped without ever running
+from zcp_core.bus import Event, publish_sync as publish
 from zcp_core.schema import validate
 from zcp_cost.plugin import CostEstimate, CostPlugin, CostRequest, PluginEstimate
 
@@ -35,18 +40,31 @@ class CostCoordinator:
         Returns:
             Blended cost estimate
         """
-        # Get estimates from all plugins
+        # Get estimates from all plugins. Plugins are independent and
+        # the accurate ones wait on NRDB, so with more than one plugin
+        # they run concurrently and the wall time is the slowest plugin
+        # rather than the sum.
         estimates: List[PluginEstimate] = []
-        for plugin in self._plugins:
-            try:
-                plugin_estimate = plugin.estimate(req)
-                estimates.append(plugin_estimate)
-            except Exception as e:
-                # Log error but continue with other plugins
-                print(f"Error in plugin {plugin.name}: {e}")
+        if len(self._plugins) > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(self._plugins)) as executor:
+                futures = [executor.submit(plugin.estimate, req) for plugin in self._plugins]
+                for plugin, future in zip(self._plugins, futures):
+                    try:
+                        estimates.append(future.result())
+                    except Exception as e:
+                        # Log error but continue with other plugins
+                        print(f"Error in plugin {plugin.name}: {e}")
+        else:
+            for plugin in self._plugins:
+                try:
+                    estimates.append(plugin.estimate(req))
+                except Exception as e:
+                    # Log error but continue with other plugins
+                    print(f"Error in plugin {plugin.name}: {e}")
         
-        # Sort by confidence (descending)
-        estimates.sort(key=lambda e: e.confidence, reverse=True)
+        # Sort by confidence (descending); attrgetter runs the key at C
+        # level instead of a Python frame per comparison
+        estimates.sort(key=attrgetter("confidence"), reverse=True)
         
         # Blend the top N estimates, weighted by confidence
         top_estimates = estimates[:self._blend_count]
@@ -58,17 +76,23 @@ class CostCoordinator:
                 breakdown=[]
             )
         
-        # Calculate weighted average
-        total_weight = sum(e.confidence for e in top_estimates)
+        # Calculate weighted average in a single pass: the weight total,
+        # weighted sum and plain sum all come from the same traversal
+        total_weight = 0.0
+        weighted_gib = 0.0
+        total_gib = 0.0
+        for e in top_estimates:
+            total_weight += e.confidence
+            weighted_gib += e.estimate_gib_per_day * e.confidence
+            total_gib += e.estimate_gib_per_day
+
         if total_weight > 0:
-            blended_gib = sum(
-                e.estimate_gib_per_day * e.confidence for e in top_estimates
-            ) / total_weight
+            blended_gib = weighted_gib / total_weight
             # Overall confidence is average of top estimates
-            overall_confidence = sum(e.confidence for e in top_estimates) / len(top_estimates)
+            overall_confidence = total_weight / len(top_estimates)
         else:
             # No confidence, use simple average
-            blended_gib = sum(e.estimate_gib_per_day for e in top_estimates) / len(top_estimates)
+            blended_gib = total_gib / len(top_estimates)
             overall_confidence = 0.0
         
         # Create and validate result
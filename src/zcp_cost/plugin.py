@@ -2,13 +2,49 @@
 Cost estimation plugin interface and implementations.
 """
 
-import abc
-from dataclasses import dataclass
 from typing import List, Protocol
 
 from pydantic import BaseModel
 
 
+def _shared_preset_loader():
+    """
+    Get the process-wide preset loader used by cost plugins.
+
+    Plugins previously built a fresh PresetLoader per estimate() call,
+    re-probing the preset directories and re-reading the preset file
+    every time; the loader shared with the rest of the process keeps
+    its preset cache warm across plugins and calls. Imported lazily so
+    the plugin module stays cheap to import.
+    """
+    from zcp_preset.loader import shared_loader
+    return shared_loader()
+
+
+def _gib_per_day(preset, host_count: int, sample_rate: int) -> float:
+    """
+    Compute estimated daily ingest in GiB from preset parameters.
+
+    Shared by the plugins and the simplified estimator so the formula
+    lives in one place instead of each caller re-deriving it.
+
+    Args:
+        preset: Loaded preset supplying per-sample size and keep ratio
+        host_count: Number of hosts
+        sample_rate: Sampling interval in seconds
+
+    Returns:
+        Estimated ingest in GiB per day
+    """
+    bytes_per_day = (
+        host_count *                       # Number of hosts
+        preset.avg_bytes_per_sample *      # Bytes per sample
+        (86400 / sample_rate) *            # Samples per day
+        preset.expected_keep_ratio         # Ratio of processes that match filter
+    )
+    return bytes_per_day / (1024 * 1024 * 1024)
+
+
 class CostRequest(BaseModel):
     """
     Request for cost estimation.
@@ -118,23 +154,11 @@ class StaticPlugin:
         Returns:
             Cost estimate
         """
-        from zcp_preset.loader import PresetLoader
-        
-        # Load the preset
-        loader = PresetLoader()
-        preset = loader.load(req.preset_id)
-        
-        # Calculate daily ingest in bytes
-        bytes_per_day = (
-            req.host_count *                   # Number of hosts
-            preset.avg_bytes_per_sample *      # Bytes per sample
-            (86400 / req.sample_rate) *        # Samples per day
-            preset.expected_keep_ratio         # Ratio of processes that match filter
-        )
-        
-        # Convert to GiB
-        gib_per_day = bytes_per_day / (1024 * 1024 * 1024)
-        
+        # Load the preset through the shared loader
+        preset = _shared_preset_loader().load(req.preset_id)
+
+        gib_per_day = _gib_per_day(preset, req.host_count, req.sample_rate)
+
         return PluginEstimate(
             plugin_name=self.name,
             estimate_gib_per_day=gib_per_day,
@@ -167,13 +191,16 @@ class HistogramPlugin:
             # This would normally query NRDB for histogram data
             # For now, just return a placeholder estimate
             # with higher confidence than static
-            
-            # Simplified model: assume 20% more accurate than static
-            static = StaticPlugin().estimate(req)
-            
+
+            # Simplified model: assume 20% more accurate than static.
+            # Uses the shared formula directly rather than constructing
+            # a throwaway StaticPlugin and intermediate PluginEstimate.
+            preset = _shared_preset_loader().load(req.preset_id)
+            static_gib = _gib_per_day(preset, req.host_count, req.sample_rate)
+
             return PluginEstimate(
                 plugin_name=self.name,
-                estimate_gib_per_day=static.estimate_gib_per_day * 1.2,
+                estimate_gib_per_day=static_gib * 1.2,
                 confidence=0.8  # Histogram-based has higher confidence
             )
         except Exception as e:
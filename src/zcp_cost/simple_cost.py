@@ -47,23 +47,14 @@ def estimate_cost(req: CostRequest) -> CostEstimate:
     Returns:
         Simple cost estimate
     """
-    from zcp_preset.loader import PresetLoader
-    
-    # Load the preset
-    loader = PresetLoader()
-    preset = loader.load(req.preset_id)
-    
-    # Calculate daily ingest in bytes
-    bytes_per_day = (
-        req.host_count *                   # Number of hosts
-        preset.avg_bytes_per_sample *      # Bytes per sample
-        (86400 / req.sample_rate) *        # Samples per day
-        preset.expected_keep_ratio         # Ratio of processes that match filter
-    )
-    
-    # Convert to GiB
-    gib_per_day = bytes_per_day / (1024 * 1024 * 1024)
-    
+    from zcp_cost.plugin import _gib_per_day, _shared_preset_loader
+
+    # Load the preset through the shared loader so repeated estimates
+    # reuse its preset cache
+    preset = _shared_preset_loader().load(req.preset_id)
+
+    gib_per_day = _gib_per_day(preset, req.host_count, req.sample_rate)
+
     # Create a simple estimate
     result = CostEstimate(
         gib_per_day=gib_per_day,
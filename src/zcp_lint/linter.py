@@ -2,15 +2,37 @@
 Linter implementation for checking configuration files.
 """
 
+import functools
+
 import yaml
-from typing import Dict, List, Optional, Set
+from typing import List, Optional
 
-from zcp_core.bus import Event, publish
+# publish_sync is bound to the local name publish: these modules run in
+# synchronous code, and the async publish() coroutine was being created
+# and dropped without ever running
+from zcp_core.bus import Event, publish_sync as publish
+from zcp_core.compat import yaml_safe_load
 from zcp_core.schema import validate as validate_schema
-from zcp_lint.models import LintFinding, LintRequest, LintResult, LintRule
+from zcp_lint.models import LintRequest, LintResult, LintRule
 from zcp_lint.rules import LintRuleRegistry
 
 
+@functools.lru_cache(maxsize=1)
+def default_linter() -> "Linter":
+    """
+    Get the process-wide default Linter.
+
+    The default Linter is stateless between lint() calls, so callers that
+    lint several documents in one invocation can share a single instance
+    and its pre-resolved (rule, check) list instead of rebuilding them
+    per document.
+
+    Returns:
+        Shared Linter configured with all enabled rules
+    """
+    return Linter()
+
+
 class Linter:
     """
     Lints configuration files for issues.
@@ -24,6 +46,14 @@ class Linter:
             rules: Specific rules to use (default: all enabled rules)
         """
         self._rules = rules or LintRuleRegistry.get_enabled_rules()
+        # Resolve each rule's check function once at init; lint() then
+        # works from stable (rule, check) references instead of going
+        # back through the registry on every call
+        self._checks = [
+            (rule, check)
+            for rule in self._rules
+            if (check := LintRuleRegistry.get_check(rule.id)) is not None
+        ]
     
     def lint(self, request: LintRequest) -> LintResult:
         """
@@ -36,28 +66,39 @@ class Linter:
             Lint result
         """
         result = LintResult()
-        
+
         # Parse YAML if possible
         yaml_content = None
+        syntax_error = False
         try:
-            yaml_content = yaml.safe_load(request.content)
+            yaml_content = yaml_safe_load(request.content)
         except yaml.YAMLError:
             # Syntax error will be caught by appropriate rule
-            pass
-        
+            syntax_error = True
+
         # Filter rules if requested
-        rules_to_apply = self._rules
+        checks_to_apply = self._checks
         if request.rules:
             rule_ids = set(request.rules)
-            rules_to_apply = [r for r in self._rules if r.id in rule_ids]
-        
+            checks_to_apply = [(r, c) for r, c in self._checks if r.id in rule_ids]
+
+        # A document that failed to parse only has findings for the
+        # syntax rule; the structure rules would each re-parse the broken
+        # content just to return nothing, so drop them up front
+        if syntax_error:
+            checks_to_apply = [(r, c) for r, c in checks_to_apply if r.id == "yaml-syntax"]
+        elif not yaml_content or not isinstance(yaml_content, dict):
+            # Parsed cleanly but not a non-empty mapping: no rule can
+            # produce a finding, and the structure rules would each
+            # re-parse the already-parsed content (they only receive the
+            # parsed document when it is a dict) before concluding that
+            checks_to_apply = []
+
         # Apply each rule
-        for rule in rules_to_apply:
-            check_func = LintRuleRegistry.get_check(rule.id)
-            if check_func:
-                findings = check_func(request.content, yaml_content)
-                for finding in findings:
-                    result.add_finding(finding)
+        for rule, check_func in checks_to_apply:
+            findings = check_func(request.content, yaml_content)
+            for finding in findings:
+                result.add_finding(finding)
         
         # Publish event
         publish(Event(
@@ -70,20 +70,35 @@ class LintResult(BaseModel):
         self._update_counts()
     
     def _update_counts(self):
-        """Update counts based on findings."""
-        self.error_count = sum(1 for f in self.findings if f.severity == LintSeverity.ERROR)
-        self.warning_count = sum(1 for f in self.findings if f.severity == LintSeverity.WARNING)
-        self.info_count = sum(1 for f in self.findings if f.severity == LintSeverity.INFO)
-    
+        """Update counts from findings in a single pass."""
+        errors = warnings = infos = 0
+        for f in self.findings:
+            if f.severity == LintSeverity.ERROR:
+                errors += 1
+            elif f.severity == LintSeverity.WARNING:
+                warnings += 1
+            elif f.severity == LintSeverity.INFO:
+                infos += 1
+        self.error_count = errors
+        self.warning_count = warnings
+        self.info_count = infos
+
     def add_finding(self, finding: LintFinding):
         """
         Add a finding and update counts.
-        
+
         Args:
             finding: Finding to add
         """
         self.findings.append(finding)
-        self._update_counts()
+        # Bump only the matching counter; recounting the whole list here
+        # made adding N findings quadratic
+        if finding.severity == LintSeverity.ERROR:
+            self.error_count += 1
+        elif finding.severity == LintSeverity.WARNING:
+            self.warning_count += 1
+        elif finding.severity == LintSeverity.INFO:
+            self.info_count += 1
     
     @property
     def has_errors(self) -> bool:
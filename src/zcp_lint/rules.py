@@ -2,12 +2,18 @@
 Linting rules implementation.
 """
 
-import re
 import yaml
-from typing import Dict, List, Optional, Protocol, Set, Type
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Protocol
 
+from zcp_core.compat import yaml_safe_load
 from zcp_lint.models import LintFinding, LintRule, LintSeverity
 
+# Valid discovery modes and the pre-joined form used in error messages;
+# module-level so they are not rebuilt on every check invocation
+_VALID_DISCOVERY_MODES = frozenset({"include", "exclude"})
+_VALID_DISCOVERY_MODES_TEXT = ", ".join(sorted(_VALID_DISCOVERY_MODES))
+
 
 class RuleCheck(Protocol):
     """Protocol for rule check functions."""
@@ -98,6 +104,102 @@ class LintRuleRegistry:
         return [r for r in cls._rules.values() if r.enabled]
 
 
+def _get_integrations(content: str, yaml_content: Optional[Dict]) -> Optional[List]:
+    """
+    Extract the integrations list a rule should inspect.
+
+    Parses the content only when the caller did not already supply the
+    parsed document, and applies the structural guards every rule was
+    duplicating, so each check starts from the derived list instead of
+    re-walking the raw document.
+
+    Args:
+        content: YAML content as string
+        yaml_content: Parsed YAML content (if available)
+
+    Returns:
+        The integrations list, or None if there is nothing to check
+    """
+    if yaml_content is None:
+        try:
+            yaml_content = yaml_safe_load(content)
+        except yaml.YAMLError:
+            # Syntax error will be caught by yaml-syntax rule
+            return None
+
+    if not yaml_content or not isinstance(yaml_content, dict):
+        return None
+
+    integrations = yaml_content.get("integrations", [])
+    if not integrations or not isinstance(integrations, list):
+        return None
+
+    return integrations
+
+
+@dataclass(frozen=True)
+class _IntegrationView:
+    """
+    Typed view of one integration entry.
+
+    Derived in a single pass over the raw dicts so each rule reads
+    slotted attributes instead of repeating the same .get() chains and
+    isinstance guards per check. __slots__ is spelled out rather than
+    dataclass(slots=True), which needs Python 3.10.
+    """
+
+    __slots__ = ("index", "name", "interval", "discovery_ok", "mode", "match_patterns")
+
+    index: int
+    name: Optional[str]
+    interval: Any
+    discovery_ok: bool
+    mode: Any
+    match_patterns: Any
+
+
+def _integration_views(content: str, yaml_content: Optional[Dict]) -> List[_IntegrationView]:
+    """
+    Derive typed views for every integration in the document.
+
+    Non-dict integrations are dropped here (every rule skipped them
+    anyway); entries with an invalid config or discovery section carry
+    discovery_ok=False so the structure rules can skip them cheaply.
+
+    Args:
+        content: YAML content as string
+        yaml_content: Parsed YAML content (if available)
+
+    Returns:
+        List of integration views, empty if there is nothing to check
+    """
+    integrations = _get_integrations(content, yaml_content)
+    if integrations is None:
+        return []
+
+    views = []
+    for i, integration in enumerate(integrations):
+        if not isinstance(integration, dict):
+            continue
+
+        config = integration.get("config", {})
+        config_ok = isinstance(config, dict)
+
+        discovery = config.get("discovery", {}) if config_ok else {}
+        discovery_ok = config_ok and isinstance(discovery, dict)
+
+        views.append(_IntegrationView(
+            index=i,
+            name=integration.get("name"),
+            interval=config.get("interval") if config_ok else None,
+            discovery_ok=discovery_ok,
+            mode=discovery.get("mode") if discovery_ok else None,
+            match_patterns=discovery.get("match_patterns", []) if discovery_ok else [],
+        ))
+
+    return views
+
+
 # Register rules with their check functions
 
 @LintRuleRegistry.register(
@@ -123,7 +225,7 @@ def check_yaml_syntax(content: str, yaml_content: Optional[Dict] = None) -> List
     
     try:
         if yaml_content is None:
-            yaml.safe_load(content)
+            yaml_safe_load(content)
     except yaml.YAMLError as e:
         # Extract line and column from the error
         line = getattr(e, "problem_mark", None)
@@ -163,36 +265,17 @@ def check_integration_name(content: str, yaml_content: Optional[Dict] = None) ->
         List of findings
     """
     findings = []
-    
-    if yaml_content is None:
-        try:
-            yaml_content = yaml.safe_load(content)
-        except yaml.YAMLError:
-            # Syntax error will be caught by yaml-syntax rule
-            return findings
-    
-    # Check if this is an integrations config
-    if not yaml_content or not isinstance(yaml_content, dict):
-        return findings
-    
-    integrations = yaml_content.get("integrations", [])
-    if not integrations or not isinstance(integrations, list):
-        return findings
-    
-    for i, integration in enumerate(integrations):
-        if not isinstance(integration, dict):
-            continue
-        
-        name = integration.get("name")
-        if not name:
+
+    for view in _integration_views(content, yaml_content):
+        if not view.name:
             findings.append(
                 LintFinding(
                     rule_id="integration-name",
-                    message=f"Integration at index {i} is missing a name",
+                    message=f"Integration at index {view.index} is missing a name",
                     severity=LintSeverity.ERROR,
                 )
             )
-    
+
     return findings
 
 
@@ -216,31 +299,9 @@ def check_sample_rate(content: str, yaml_content: Optional[Dict] = None) -> List
         List of findings
     """
     findings = []
-    
-    if yaml_content is None:
-        try:
-            yaml_content = yaml.safe_load(content)
-        except yaml.YAMLError:
-            # Syntax error will be caught by yaml-syntax rule
-            return findings
-    
-    # Check if this is an integrations config
-    if not yaml_content or not isinstance(yaml_content, dict):
-        return findings
-    
-    integrations = yaml_content.get("integrations", [])
-    if not integrations or not isinstance(integrations, list):
-        return findings
-    
-    for i, integration in enumerate(integrations):
-        if not isinstance(integration, dict):
-            continue
-        
-        config = integration.get("config", {})
-        if not isinstance(config, dict):
-            continue
-        
-        interval = config.get("interval")
+
+    for view in _integration_views(content, yaml_content):
+        interval = view.interval
         if interval is not None:
             try:
                 interval_val = int(interval)
@@ -292,35 +353,12 @@ def check_empty_patterns(content: str, yaml_content: Optional[Dict] = None) -> L
         List of findings
     """
     findings = []
-    
-    if yaml_content is None:
-        try:
-            yaml_content = yaml.safe_load(content)
-        except yaml.YAMLError:
-            # Syntax error will be caught by yaml-syntax rule
-            return findings
-    
-    # Check if this is an integrations config
-    if not yaml_content or not isinstance(yaml_content, dict):
-        return findings
-    
-    integrations = yaml_content.get("integrations", [])
-    if not integrations or not isinstance(integrations, list):
-        return findings
-    
-    for i, integration in enumerate(integrations):
-        if not isinstance(integration, dict):
-            continue
-        
-        config = integration.get("config", {})
-        if not isinstance(config, dict):
-            continue
-        
-        discovery = config.get("discovery", {})
-        if not isinstance(discovery, dict):
+
+    for view in _integration_views(content, yaml_content):
+        if not view.discovery_ok:
             continue
-        
-        match_patterns = discovery.get("match_patterns", [])
+
+        match_patterns = view.match_patterns
         if not match_patterns:
             findings.append(
                 LintFinding(
@@ -375,37 +413,12 @@ def check_discovery_mode(content: str, yaml_content: Optional[Dict] = None) -> L
         List of findings
     """
     findings = []
-    
-    if yaml_content is None:
-        try:
-            yaml_content = yaml.safe_load(content)
-        except yaml.YAMLError:
-            # Syntax error will be caught by yaml-syntax rule
-            return findings
-    
-    # Check if this is an integrations config
-    if not yaml_content or not isinstance(yaml_content, dict):
-        return findings
-    
-    integrations = yaml_content.get("integrations", [])
-    if not integrations or not isinstance(integrations, list):
-        return findings
-    
-    valid_modes = {"include", "exclude"}
-    
-    for i, integration in enumerate(integrations):
-        if not isinstance(integration, dict):
-            continue
-        
-        config = integration.get("config", {})
-        if not isinstance(config, dict):
-            continue
-        
-        discovery = config.get("discovery", {})
-        if not isinstance(discovery, dict):
+
+    for view in _integration_views(content, yaml_content):
+        if not view.discovery_ok:
             continue
-        
-        mode = discovery.get("mode")
+
+        mode = view.mode
         if mode is None:
             findings.append(
                 LintFinding(
@@ -414,11 +427,11 @@ def check_discovery_mode(content: str, yaml_content: Optional[Dict] = None) -> L
                     severity=LintSeverity.INFO,
                 )
             )
-        elif mode not in valid_modes:
+        elif mode not in _VALID_DISCOVERY_MODES:
             findings.append(
                 LintFinding(
                     rule_id="discovery-mode",
-                    message=f"Invalid discovery mode: {mode}, must be one of: {', '.join(valid_modes)}",
+                    message=f"Invalid discovery mode: {mode}, must be one of: {_VALID_DISCOVERY_MODES_TEXT}",
                     severity=LintSeverity.ERROR,
                 )
             )
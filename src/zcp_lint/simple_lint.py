@@ -10,8 +10,15 @@ import yaml
 from enum import Enum
 from typing import Dict, List, Optional
 
+from zcp_core.compat import yaml_safe_load
+
 logger = logging.getLogger(__name__)
 
+# Valid discovery modes and the pre-joined form used in error messages;
+# module-level so they are not rebuilt on every lint_config call
+_VALID_DISCOVERY_MODES = frozenset({"include", "exclude"})
+_VALID_DISCOVERY_MODES_TEXT = ", ".join(sorted(_VALID_DISCOVERY_MODES))
+
 class LintSeverity(str, Enum):
     """Severity levels for lint findings."""
     ERROR = "error"
@@ -34,28 +41,33 @@ class LintFinding:
 
 class LintResult:
     """Result of linting a configuration file."""
-    
+
     def __init__(self):
         self.findings: List[LintFinding] = []
-    
+        # Severity tallies maintained as findings are added, so the
+        # count properties don't each re-scan the findings list
+        self._severity_counts: Dict[LintSeverity, int] = {}
+
     @property
     def has_errors(self) -> bool:
         """Check if there are any errors."""
-        return any(f.severity == LintSeverity.ERROR for f in self.findings)
-    
+        return self.error_count > 0
+
     @property
     def error_count(self) -> int:
         """Get the number of errors."""
-        return sum(1 for f in self.findings if f.severity == LintSeverity.ERROR)
-    
+        return self._severity_counts.get(LintSeverity.ERROR, 0)
+
     @property
     def warning_count(self) -> int:
         """Get the number of warnings."""
-        return sum(1 for f in self.findings if f.severity == LintSeverity.WARNING)
-    
+        return self._severity_counts.get(LintSeverity.WARNING, 0)
+
     def add_finding(self, finding: LintFinding):
         """Add a finding to the result."""
         self.findings.append(finding)
+        self._severity_counts[finding.severity] = \
+            self._severity_counts.get(finding.severity, 0) + 1
     
     def __str__(self):
         return f"Lint result: {self.error_count} errors, {self.warning_count} warnings"
@@ -82,7 +94,7 @@ def lint_config(content: str) -> LintResult:
     # Parse YAML if possible
     yaml_content = None
     try:
-        yaml_content = yaml.safe_load(content)
+        yaml_content = yaml_safe_load(content)
     except yaml.YAMLError as e:
         # Extract line and column from the error
         line = getattr(e, "problem_mark", None)
@@ -121,8 +133,6 @@ def lint_config(content: str) -> LintResult:
         return result
     
     # Check each integration
-    valid_modes = {"include", "exclude"}
-    
     for i, integration in enumerate(integrations):
         if not isinstance(integration, dict):
             result.add_finding(
@@ -199,10 +209,10 @@ def lint_config(content: str) -> LintResult:
                     severity=LintSeverity.INFO
                 )
             )
-        elif mode not in valid_modes:
+        elif mode not in _VALID_DISCOVERY_MODES:
             result.add_finding(
                 LintFinding(
-                    message=f"Invalid discovery mode: {mode}, must be one of: {', '.join(valid_modes)}",
+                    message=f"Invalid discovery mode: {mode}, must be one of: {_VALID_DISCOVERY_MODES_TEXT}",
                     severity=LintSeverity.ERROR
                 )
             )
@@ -235,6 +245,6 @@ def lint_config(content: str) -> LintResult:
                     )
     
     # Log summary
-    logger.info(f"Linting complete: {result.error_count} errors, {result.warning_count} warnings")
+    logger.info("Linting complete: %d errors, %d warnings", result.error_count, result.warning_count)
     
     return result
@@ -10,10 +10,7 @@ import time
 import traceback
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, Iterator, List, Optional, Union
-
-from zcp_core.bus import Event, publish
-
+from typing import Any, Dict, Iterator
 
 class LoggerFactory:
     """
@@ -137,19 +134,44 @@ class JsonFormatter(logging.Formatter):
     """
     JSON formatter for structured logging.
     """
-    
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_second = -1
+        self._last_second_iso = ""
+
+    def _format_timestamp(self, created: float) -> str:
+        """
+        Format a record timestamp as an ISO-8601 string.
+
+        The whole-second part is cached: records logged within the same
+        second reuse it and only the microseconds are formatted, instead
+        of building a datetime object per record.
+
+        Args:
+            created: Record creation time (seconds since the epoch)
+
+        Returns:
+            ISO-formatted timestamp with microsecond precision
+        """
+        second = int(created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_second_iso = datetime.fromtimestamp(second).isoformat()
+        return f"{self._last_second_iso}.{int((created - second) * 1_000_000):06d}"
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format record as JSON.
-        
+
         Args:
             record: Log record
-            
+
         Returns:
             JSON-formatted log entry
         """
         log_object = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -268,6 +290,11 @@ class BoundLogger:
             *args: Arguments for message formatting
             **kwargs: Additional context or logging parameters
         """
+        # Suppressed levels exit before any context assembly: a DEBUG
+        # call at INFO level should cost a level check, not dict merges
+        if not self._logger.isEnabledFor(level):
+            return
+
         # Extract context and extra
         context = kwargs.pop("context", {})
         extra = kwargs.pop("extra", {})
@@ -282,8 +309,14 @@ class BoundLogger:
         # Log the message
         self._logger.log(level, msg, *args, extra=extra, **kwargs)
         
-        # Publish event for critical or error logs
+        # Publish event for critical or error logs. The bus (and its
+        # asyncio/pydantic import chain) is only pulled in here, so CLI
+        # startup does not pay for it unless an error is actually logged.
+        # publish_sync rather than publish: this is synchronous code, and
+        # the async publish() coroutine would be created and dropped
+        # without ever running.
         if level >= logging.ERROR:
+            from zcp_core.bus import Event, publish_sync as publish
             publish(Event(
                 topic="logging.error",
                 payload={
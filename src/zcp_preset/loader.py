@@ -2,14 +2,87 @@
 Preset loader implementation.
 """
 
+import functools
 import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from zcp_core.bus import Event, publish
+# publish_sync is bound to the local name publish: these modules run in
+# synchronous code, and the async publish() coroutine was being created
+# and dropped without ever running
+from zcp_core.bus import Event, publish_sync as publish
 from zcp_preset.model import Preset
 
 
+@functools.lru_cache(maxsize=8)
+def _scan_preset_dirs(dirs_key: Tuple[Tuple[str, int], ...]) -> Tuple[str, ...]:
+    """
+    Scan preset directories for preset IDs, cached per directory state.
+
+    Keyed on (directory, mtime_ns) pairs: repeated list() calls reuse the
+    scan while an added or removed preset file bumps the directory mtime
+    and invalidates the entry.
+
+    Args:
+        dirs_key: (directory, mtime_ns) pairs to scan
+
+    Returns:
+        Sorted preset IDs
+    """
+    presets = set()
+
+    # os.scandir reuses the type information from the directory read
+    # itself, where glob() would re-stat entries and compile a
+    # wildcard pattern per call
+    for directory, _mtime_ns in dirs_key:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".yaml") and entry.is_file():
+                        presets.add(entry.name[:-5])
+        except Exception:
+            # Skip directories that can't be read
+            pass
+
+    return tuple(sorted(presets))
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_preset_file(path: str, mtime_ns: int, size: int) -> Preset:
+    """
+    Read and parse a preset file, cached per (path, mtime, size).
+
+    Separate PresetLoader instances each keep their own id cache, so the
+    same file was read, YAML-parsed and sha256-hashed once per instance.
+    Keying on the stat fingerprint shares the parse process-wide while
+    still picking up edited files.
+
+    Args:
+        path: Preset file path
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        The parsed preset
+    """
+    return Preset.from_yaml(Path(path).read_text())
+
+
+@functools.lru_cache(maxsize=1)
+def shared_loader() -> "PresetLoader":
+    """
+    Get the process-wide preset loader for the default directories.
+
+    Each caller building its own PresetLoader starts with a cold id
+    cache and re-probes the preset directories; sharing one instance
+    keeps both warm across components in the same process.
+
+    Returns:
+        Shared loader instance
+    """
+    return PresetLoader()
+
+
 class PresetLoader:
     """
     Loads presets from the filesystem.
@@ -28,44 +101,56 @@ class PresetLoader:
         """
         self._dirs = dirs or self._default_dirs()
         self._cache: Dict[str, Preset] = {}
+        self._existing_dirs: Optional[List[str]] = None
         
     @staticmethod
-    def _default_dirs() -> List[str]:
-        """Get default preset directories."""
+    @functools.lru_cache(maxsize=1)
+    def _default_dirs() -> Tuple[str, ...]:
+        """Get default preset directories (detected once per process)."""
         # From lowest to highest precedence
         dirs = []
-        
+
         # Built-in presets
         module_dir = Path(__file__).parent
         dirs.append(str(module_dir / "presets"))
-        
+
         # User presets
         user_preset_dir = os.environ.get("ZCP_PRESET_DIR")
         if user_preset_dir:
             dirs.append(user_preset_dir)
-            
-        return dirs
+
+        return tuple(dirs)
     
+    def _available_dirs(self) -> List[str]:
+        """
+        Get the preset directories that actually exist.
+
+        Probed once per loader instance: every list()/load() call was
+        previously paying a stat per configured directory.
+
+        Returns:
+            Existing preset directories, in precedence order
+        """
+        if self._existing_dirs is None:
+            self._existing_dirs = [d for d in self._dirs if Path(d).is_dir()]
+        return self._existing_dirs
+
     def list(self) -> List[str]:
         """
         List available preset IDs.
-        
+
         Returns:
             List of preset IDs
         """
-        presets = set()
-        
-        for directory in self._dirs:
+        dirs_key = []
+        for directory in self._available_dirs():
             try:
-                path = Path(directory)
-                if path.exists() and path.is_dir():
-                    for file in path.glob("*.yaml"):
-                        presets.add(file.stem)
-            except Exception:
-                # Skip directories that can't be read
-                pass
-                
-        return sorted(list(presets))
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            dirs_key.append((directory, mtime_ns))
+
+        return list(_scan_preset_dirs(tuple(dirs_key)))
     
     def load(self, id: str) -> Preset:
         """
@@ -85,24 +170,27 @@ class PresetLoader:
             return self._cache[id]
         
         # Search directories in reverse order (highest precedence first)
-        for directory in reversed(self._dirs):
+        for directory in reversed(self._available_dirs()):
             path = Path(directory) / f"{id}.yaml"
-            if path.exists() and path.is_file():
-                with open(path, "r") as f:
-                    yml = f.read()
-                    preset = Preset.from_yaml(yml)
-                    
-                    # Emit event
-                    publish(Event(
-                        topic="preset.loaded",
-                        payload={
-                            "id": preset.id,
-                            "hash": preset.sha256
-                        }
-                    ))
-                    
-                    # Cache and return
-                    self._cache[id] = preset
-                    return preset
+            try:
+                st = path.stat()
+            except OSError:
+                # Missing in this directory; try the next one
+                continue
+
+            preset = _parse_preset_file(str(path), st.st_mtime_ns, st.st_size)
+
+            # Emit event
+            publish(Event(
+                topic="preset.loaded",
+                payload={
+                    "id": preset.id,
+                    "hash": preset.sha256
+                }
+            ))
+
+            # Cache and return
+            self._cache[id] = preset
+            return preset
         
         raise FileNotFoundError(f"Preset not found: {id}")
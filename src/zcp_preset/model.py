@@ -3,12 +3,12 @@ Preset model definitions.
 """
 
 import hashlib
-import json
 from typing import ClassVar, List, Optional
 
-import yaml
 from pydantic import BaseModel, Field, validator
 
+from zcp_core.compat import json_dumps_pretty, yaml_safe_load
+
 
 class Preset(BaseModel):
     """
@@ -25,13 +25,15 @@ class Preset(BaseModel):
     avg_bytes_per_sample: int
     sha256: Optional[str] = None
     
-    # Class-level constants
+    # Class-level constants; the list keeps display order for error
+    # messages, the frozenset makes the validator check O(1)
     FILTER_MODES: ClassVar[List[str]] = ["include", "exclude"]
-    
+    _FILTER_MODE_SET: ClassVar[frozenset] = frozenset(FILTER_MODES)
+
     @validator("filter_mode")
     def validate_filter_mode(cls, v):
         """Validate filter mode is one of the allowed values."""
-        if v not in cls.FILTER_MODES:
+        if v not in cls._FILTER_MODE_SET:
             raise ValueError(f"filter_mode must be one of {cls.FILTER_MODES}")
         return v
     
@@ -53,7 +55,7 @@ class Preset(BaseModel):
         Returns:
             A new Preset instance
         """
-        data = yaml.safe_load(yml)
+        data = yaml_safe_load(yml)
         
         # Calculate SHA-256 hash of the input YAML
         data["sha256"] = hashlib.sha256(yml.encode()).hexdigest()
@@ -67,4 +69,4 @@ class Preset(BaseModel):
         Returns:
             JSON string representation of the preset
         """
-        return json.dumps(self.dict(), indent=2)
+        return json_dumps_pretty(self.dict())
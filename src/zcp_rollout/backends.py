@@ -2,11 +2,10 @@
 Rollout backend implementations.
 """
 
-import abc
 import os
-import tempfile
+import sys
 import time
-from typing import Dict, List, Protocol, Tuple
+from typing import Protocol
 
 from zcp_rollout.models import HostResult, RolloutHost
 
@@ -61,7 +60,7 @@ class PrintBackend:
             Success result
         """
         target_path = os.path.join(host.target_path, filename)
-        print(f"[DRY-RUN] Would transfer {len(content)} bytes to {host.hostname}:{target_path}")
+        sys.stdout.write(f"[DRY-RUN] Would transfer {len(content)} bytes to {host.hostname}:{target_path}\n")
         
         return HostResult(
             hostname=host.hostname,
@@ -80,7 +79,7 @@ class PrintBackend:
         Returns:
             Success result
         """
-        print(f"[DRY-RUN] Would restart agent on {host.hostname}")
+        sys.stdout.write(f"[DRY-RUN] Would restart agent on {host.hostname}\n")
         
         return HostResult(
             hostname=host.hostname,
@@ -148,7 +147,7 @@ class SSHBackend:
             target_path = os.path.join(host.target_path, filename)
             
             # For demonstration purposes, just log what would happen
-            print(f"[SSH] Would transfer to {host.hostname}:{target_path}")
+            sys.stdout.write(f"[SSH] Would transfer to {host.hostname}:{target_path}\n")
             
             duration_ms = (time.time() - start_time) * 1000
             return HostResult(
@@ -187,7 +186,7 @@ class SSHBackend:
             cmd = "sudo systemctl restart newrelic-infra" if host.use_sudo else "systemctl restart newrelic-infra"
             
             # For demonstration purposes, just log what would happen
-            print(f"[SSH] Would execute on {host.hostname}: {cmd}")
+            sys.stdout.write(f"[SSH] Would execute on {host.hostname}: {cmd}\n")
             
             duration_ms = (time.time() - start_time) * 1000
             return HostResult(
@@ -247,7 +246,7 @@ class AnsibleBackend:
             target_path = os.path.join(host.target_path, filename)
             
             # For demonstration purposes, just log what would happen
-            print(f"[Ansible] Would transfer to {host.hostname}:{target_path}")
+            sys.stdout.write(f"[Ansible] Would transfer to {host.hostname}:{target_path}\n")
             
             duration_ms = (time.time() - start_time) * 1000
             return HostResult(
@@ -286,7 +285,7 @@ class AnsibleBackend:
             cmd = f"ansible {host.hostname} -m service -a 'name=newrelic-infra state=restarted' {become_flag}"
             
             # For demonstration purposes, just log what would happen
-            print(f"[Ansible] Would execute: {cmd}")
+            sys.stdout.write(f"[Ansible] Would execute: {cmd}\n")
             
             duration_ms = (time.time() - start_time) * 1000
             return HostResult(
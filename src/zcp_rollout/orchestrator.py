@@ -4,9 +4,12 @@ Rollout orchestration implementation.
 
 import concurrent.futures
 import time
-from typing import Dict, List, Optional, Tuple, Type
+from typing import Dict, Optional
 
-from zcp_core.bus import Event, publish
+# publish_sync is bound to the local name publish: these modules run in
+# synchronous code, and the async publish() coroutine was being created
+# and dropped without ever running
+from zcp_core.bus import Event, publish_sync as publish
 from zcp_rollout.backends import AnsibleBackend, BaseBackend, PrintBackend, SSHBackend
 from zcp_rollout.models import HostResult, RolloutHost, RolloutJob, RolloutReport
 
@@ -91,19 +94,23 @@ class RolloutOrchestrator:
         backend = self._get_backend(mode)
         results: Dict[str, HostResult] = {}
         
-        # Process hosts in parallel
+        # Process hosts in parallel, counting successes as results
+        # arrive instead of re-walking the result dict afterwards
+        success_count = 0
         with concurrent.futures.ThreadPoolExecutor(max_workers=job.parallel) as executor:
             future_to_host = {
                 executor.submit(
                     self._process_host, host, job.config_content, job.config_filename, backend
                 ): host for host in job.hosts
             }
-            
+
             for future in concurrent.futures.as_completed(future_to_host):
                 host = future_to_host[future]
                 try:
                     result = future.result()
                     results[host.hostname] = result
+                    if result.success:
+                        success_count += 1
                 except Exception as e:
                     # Handle exceptions from threads
                     results[host.hostname] = HostResult(
@@ -111,9 +118,8 @@ class RolloutOrchestrator:
                         success=False,
                         message=f"Error: {str(e)}"
                     )
-        
+
         # Calculate statistics
-        success_count = sum(1 for r in results.values() if r.success)
         fail_count = len(results) - success_count
         duration_s = time.time() - start_time
         
@@ -2,9 +2,10 @@
 Simplified rollout implementation.
 
 This module provides a straightforward way to deploy configurations to hosts,
-without the complexity of multiple backends or parallel execution.
+without the complexity of multiple backends.
 """
 
+import concurrent.futures
 import logging
 import os
 import time
@@ -49,64 +50,95 @@ class RolloutSummary:
         return (f"Rollout complete: {self.success}/{self.total} hosts successful "
                 f"({self.success_rate:.1f}%) in {self.duration_ms/1000:.2f}s")
 
-def rollout_config(hosts: List[Host], config_content: str, filename: str, 
-                   dry_run: bool = True) -> RolloutSummary:
+def _rollout_host(host: Host, config_content: str, filename: str,
+                  dry_run: bool) -> RolloutResult:
+    """
+    Deploy a configuration to a single host.
+
+    Args:
+        host: Target host
+        config_content: Configuration content to deploy
+        filename: Target filename
+        dry_run: Whether to actually deploy or just simulate
+
+    Returns:
+        Result for this host
+    """
+    host_start = time.time()
+    target_path = os.path.join(host.target_path, filename)
+
+    try:
+        # In a real implementation, this would actually transfer the file.
+        # For dry-run, just log what would happen. Lazy %-style args so
+        # these per-host messages are only formatted when INFO is on.
+        logger.info("Would transfer %d bytes to %s:%s", len(config_content), host.hostname, target_path)
+
+        if not dry_run:
+            # This would be real implementation
+            logger.info("Actually deploying to %s (not implemented)", host.hostname)
+            # For now it's just a placeholder - actual SSH implementation would go here
+
+        # Simulate restart
+        logger.info("Would restart agent on %s", host.hostname)
+
+        duration_ms = (time.time() - host_start) * 1000
+        return RolloutResult(
+            hostname=host.hostname,
+            success=True,
+            message=f"Configuration {'would be' if dry_run else 'was'} deployed to {target_path}",
+            duration_ms=duration_ms
+        )
+    except Exception as e:
+        duration_ms = (time.time() - host_start) * 1000
+        return RolloutResult(
+            hostname=host.hostname,
+            success=False,
+            message=f"Error: {str(e)}",
+            duration_ms=duration_ms
+        )
+
+def rollout_config(hosts: List[Host], config_content: str, filename: str,
+                   dry_run: bool = True, max_workers: int = 4) -> RolloutSummary:
     """
     Roll out a configuration to multiple hosts.
-    
-    This is a simplified implementation that:
-    1. Loops through hosts sequentially (no parallelism)
-    2. Uses a single "print" backend that simulates deployment
-    3. Returns a basic summary of results
-    
+
+    Hosts are deployed in parallel with a small thread pool: each host is
+    dominated by I/O wait (transfer + restart), so threads are sufficient.
+
     Args:
         hosts: List of target hosts
         config_content: Configuration content to deploy
         filename: Target filename
         dry_run: Whether to actually deploy or just simulate
-            
+        max_workers: Maximum number of hosts to deploy concurrently
+
     Returns:
         Summary of rollout results
     """
+    # Nothing to deploy: skip thread pool setup entirely
+    if not hosts:
+        summary = RolloutSummary(total=0, success=0, failure=0, duration_ms=0.0, results={})
+        logger.info("%s", summary)
+        return summary
+
     start_time = time.time()
     results: Dict[str, RolloutResult] = {}
-    
-    for host in hosts:
-        host_start = time.time()
-        target_path = os.path.join(host.target_path, filename)
-        
-        try:
-            # In a real implementation, this would actually transfer the file
-            # For dry-run, just log what would happen
-            logger.info(f"Would transfer {len(config_content)} bytes to {host.hostname}:{target_path}")
-            
-            if not dry_run:
-                # This would be real implementation
-                logger.info(f"Actually deploying to {host.hostname} (not implemented)")
-                # For now it's just a placeholder - actual SSH implementation would go here
-            
-            # Simulate restart
-            logger.info(f"Would restart agent on {host.hostname}")
-            
-            duration_ms = (time.time() - host_start) * 1000
-            results[host.hostname] = RolloutResult(
-                hostname=host.hostname,
-                success=True,
-                message=f"Configuration {'would be' if dry_run else 'was'} deployed to {target_path}",
-                duration_ms=duration_ms
-            )
-        except Exception as e:
-            duration_ms = (time.time() - host_start) * 1000
-            results[host.hostname] = RolloutResult(
-                hostname=host.hostname,
-                success=False,
-                message=f"Error: {str(e)}",
-                duration_ms=duration_ms
-            )
-    
-    # Calculate summary
+    success_count = 0
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_host = {
+            executor.submit(_rollout_host, host, config_content, filename, dry_run): host
+            for host in hosts
+        }
+
+        for future in concurrent.futures.as_completed(future_to_host):
+            result = future.result()
+            results[result.hostname] = result
+            if result.success:
+                success_count += 1
+
+    # Calculate summary; successes were counted during the rollout loop
     total_duration_ms = (time.time() - start_time) * 1000
-    success_count = sum(1 for r in results.values() if r.success)
     fail_count = len(results) - success_count
     
     summary = RolloutSummary(
@@ -117,5 +149,5 @@ def rollout_config(hosts: List[Host], config_content: str, filename: str,
         results=results
     )
     
-    logger.info(str(summary))
+    logger.info("%s", summary)
     return summary
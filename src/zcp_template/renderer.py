@@ -2,16 +2,20 @@
 Template renderer implementation.
 """
 
+import functools
 import hashlib
 import os
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import jinja2
 from pydantic import BaseModel, Field
 
-from zcp_core.bus import Event, publish
+# publish_sync is bound to the local name publish: these modules run in
+# synchronous code, and the async publish() coroutine was being created
+# and dropped without ever running
+from zcp_core.bus import Event, publish_sync as publish
 
 
 class TokensBase(BaseModel):
@@ -56,6 +60,21 @@ class RenderedYAML(BaseModel):
     duration_ms: float
 
 
+@functools.lru_cache(maxsize=1)
+def shared_renderer() -> "TemplateRenderer":
+    """
+    Get the process-wide renderer for the default template directories.
+
+    A fresh TemplateRenderer per caller rebuilds the Jinja environment
+    and recompiles every template it touches; sharing one instance keeps
+    the compiled templates and the render cache warm across components.
+
+    Returns:
+        Shared renderer instance
+    """
+    return TemplateRenderer()
+
+
 class TemplateRenderer:
     """
     Renders templates with provided tokens.
@@ -70,49 +89,71 @@ class TemplateRenderer:
         """
         self._dirs = template_dirs or self._default_dirs()
         
-        # Set up Jinja environment
+        # Set up Jinja environment. Templates ship with the package and
+        # don't change mid-run, so disable auto_reload: otherwise every
+        # get_template() re-stats the file to check for modifications
+        # even when the compiled template is already cached.
         loader = jinja2.FileSystemLoader(self._dirs)
         self._env = jinja2.Environment(
             loader=loader,
             trim_blocks=True,
             lstrip_blocks=True,
-            autoescape=False
+            autoescape=False,
+            auto_reload=False,
+            cache_size=400
         )
+        self._render_cache: Dict[Tuple[str, str], RenderedYAML] = {}
+        self._templates: Dict[str, jinja2.Template] = {}
     
     @staticmethod
-    def _default_dirs() -> List[str]:
-        """Get default template directories."""
+    @functools.lru_cache(maxsize=1)
+    def _default_dirs() -> Tuple[str, ...]:
+        """Get default template directories (detected once per process)."""
         dirs = []
-        
+
         # Built-in templates
         module_dir = Path(__file__).parent
         dirs.append(str(module_dir / "templates"))
-        
+
         # User templates
         user_template_dir = os.environ.get("ZCP_TEMPLATE_DIR")
         if user_template_dir:
             dirs.append(user_template_dir)
-            
-        return dirs
+
+        return tuple(dirs)
     
     def render(self, req: RenderRequest) -> RenderedYAML:
         """
         Render a template with provided tokens.
-        
+
+        Identical requests are served from a per-renderer cache: the same
+        template and tokens always produce the same output, so a sweep
+        over many hosts pays for one render and one checksum. Cache hits
+        do not re-publish the template.rendered event.
+
         Args:
             req: Render request
-            
+
         Returns:
             Rendered template
-            
+
         Raises:
             jinja2.exceptions.TemplateNotFound: If template not found
             jinja2.exceptions.TemplateError: If template rendering fails
         """
+        cache_key = (req.template_id, req.tokens.json())
+        cached = self._render_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         start_time = time.time()
-        
-        # Load template
-        template = self._env.get_template(f"{req.template_id}.yaml.j2")
+
+        # Load template; keep the compiled Template handle so repeated
+        # renders skip the environment's loader lookup entirely
+        template = self._templates.get(req.template_id)
+        if template is None:
+            template = self._env.get_template(f"{req.template_id}.yaml.j2")
+            self._templates[req.template_id] = template
         
         # Render
         result = template.render(**req.tokens.dict())
@@ -137,7 +178,8 @@ class TemplateRenderer:
                 "duration_ms": duration_ms
             }
         ))
-        
+
+        self._render_cache[cache_key] = rendered
         return rendered
     
     def validate(self, text: str) -> None:
@@ -4,14 +4,31 @@ NRDB client for querying New Relic data.
 Implements a client with circuit breaker pattern and error handling.
 """
 
+import concurrent.futures
+import functools
+import hashlib
 import json
 import os
+import random
 import time
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import requests
 from pydantic import BaseModel
 
+from zcp_core.compat import json_dumps_bytes, json_loads
+
+# Optional HTTP/2 transport: httpx multiplexes concurrent requests over
+# a single TLS connection, avoiding HTTP/1.1 head-of-line blocking when
+# query_many fans out. Falls back to requests when not installed.
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 
 class NRDBConfig(BaseModel):
     """
@@ -23,6 +40,149 @@ class NRDBConfig(BaseModel):
     timeout_s: int = 30
     circuit_breaker_threshold: int = 3
     circuit_breaker_reset_s: int = 60
+    cache_max_entries: int = 128
+    cache_ttl_s: int = 300
+    max_retries: int = 2
+    retry_deadline_s: int = 60
+    use_persisted_queries: bool = False
+    transport: str = "requests"  # requests or httpx-h2
+
+
+# Single GraphQL document used for all NRQL queries, built once at
+# import instead of reallocated per call. Only the account id and NRQL
+# text vary, which keeps the document stable for APQ hash memoization.
+_NRQL_DOCUMENT = """
+{
+    actor {
+        account(id: %s) {
+            nrql(query: "%s") {
+                results
+            }
+        }
+    }
+}
+"""
+
+
+def _env_first(*names: str, default: str = "") -> str:
+    """
+    Return the first non-empty value among several environment variables.
+
+    Keeps credential fallback logic in one place so every consumer
+    honours the same variables in the same order.
+
+    Args:
+        *names: Environment variable names, in order of precedence
+        default: Value to return when none are set
+
+    Returns:
+        First non-empty value, or the default
+    """
+    for name in names:
+        value = os.environ.get(name)
+        if value:
+            return value
+    return default
+
+
+def api_key_from_env() -> str:
+    """
+    Look up the New Relic API key from the environment.
+
+    Checks NEW_RELIC_API_KEY first and falls back to
+    NEW_RELIC_LICENSE_KEY, which some agent installs export instead.
+
+    Returns:
+        API key, or "" if neither variable is set
+    """
+    return _env_first("NEW_RELIC_API_KEY", "NEW_RELIC_LICENSE_KEY")
+
+
+@functools.lru_cache(maxsize=4)
+def get_shared_client(api_key: str, account_id: str, region: str = "us") -> "NRDBClient":
+    """
+    Get (or create) a process-wide client for the given account.
+
+    Components that construct their own NRDBClient each start with an
+    empty result cache and a cold connection pool. Sharing one client
+    per (api_key, account_id, region) lets later calls in the same
+    process reuse warm caches and established TLS connections.
+
+    Args:
+        api_key: New Relic API key
+        account_id: New Relic account ID
+        region: API region (us or eu)
+
+    Returns:
+        Shared client instance
+    """
+    return NRDBClient(NRDBConfig(
+        api_key=api_key,
+        account_id=account_id,
+        region=region
+    ))
+
+
+def default_shared_client() -> "NRDBClient":
+    """
+    Get the shared client for the environment-configured account.
+
+    Returns:
+        Shared client instance
+    """
+    config = NRDBClient._default_config()
+    return get_shared_client(config.api_key, config.account_id, config.region)
+
+
+def extract_nrql_results(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Extract the NRQL results list from a GraphQL response document.
+
+    A single try/except walk replaces the chained
+    .get("data", {}).get("actor", {})... pattern, which allocated a
+    fresh empty dict per level on every miss.
+
+    Args:
+        data: Parsed GraphQL response
+
+    Returns:
+        NRQL results list, or [] if the path is absent
+    """
+    try:
+        return data["data"]["actor"]["account"]["nrql"]["results"]
+    except (KeyError, TypeError):
+        return []
+
+
+def escape_nrql_string(value: str) -> str:
+    """
+    Escape a value for interpolation into a single-quoted NRQL string.
+
+    Hostnames and filter values come from user-supplied plans; escaping
+    backslashes and single quotes keeps a crafted value from breaking
+    out of its string literal and rewriting the query.
+
+    Args:
+        value: Raw string value
+
+    Returns:
+        Escaped string, safe inside single quotes
+    """
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+@functools.lru_cache(maxsize=64)
+def _persisted_query_hash(document: str) -> str:
+    """
+    Compute (and memoize) the APQ sha256 hash for a GraphQL document.
+
+    Args:
+        document: GraphQL document text
+
+    Returns:
+        Hex-encoded sha256 hash
+    """
+    return hashlib.sha256(document.encode()).hexdigest()
 
 
 class CircuitBreaker:
@@ -85,15 +245,18 @@ class CircuitBreaker:
 class NRDBClient:
     """
     Client for querying NRDB (New Relic Database).
-    
+
     Implements circuit breaker pattern to prevent overwhelming the API
     during outages or excessive errors.
+
+    Uses a persistent requests.Session so that repeated queries reuse
+    the same TCP/TLS connection instead of paying a handshake per call.
     """
-    
+
     def __init__(self, config: Optional[NRDBConfig] = None):
         """
         Initialize NRDB client.
-        
+
         Args:
             config: Client configuration
         """
@@ -102,32 +265,411 @@ class NRDBClient:
             threshold=self._config.circuit_breaker_threshold,
             reset_seconds=self._config.circuit_breaker_reset_s
         )
+        if self._config.transport == "httpx-h2":
+            self._session = self._build_httpx_client()
+            self._transport_errors = (requests.exceptions.RequestException, httpx.HTTPError)
+        else:
+            self._session = requests.Session()
+            self._session.headers.update(self._get_headers())
+            self._session.mount(
+                "https://",
+                requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            )
+            self._transport_errors = (requests.exceptions.RequestException,)
+        # LRU cache of query results, bounded by size and TTL. Keys are
+        # cheap fixed-size digests of the NRQL text rather than the full
+        # query string. Values are serialized JSON bytes so that each
+        # cache hit hands out a private object graph - callers routinely
+        # mutate nested result dicts, which would otherwise corrupt the
+        # cached entry. Each entry also records the response ETag (when
+        # the server sent one) so expired entries can be revalidated
+        # with If-None-Match instead of re-downloading the full body.
+        self._cache: "OrderedDict[bytes, Tuple[float, bytes, Optional[str]]]" = OrderedDict()
+
+    @property
+    def has_credentials(self) -> bool:
+        """
+        Whether the client is configured with an API key and account ID.
+
+        query() raises ValueError without these; callers can check this
+        up front and skip building queries that could never be sent.
+
+        Returns:
+            True if both API key and account ID are set
+        """
+        return bool(self._config.api_key and self._config.account_id)
+
+    @staticmethod
+    def _cache_key(nrql: str) -> bytes:
+        """
+        Compute a compact cache key for an NRQL query.
+
+        blake2b with a 16-byte digest is significantly cheaper than
+        sha256 and avoids keeping full query strings as dict keys.
+
+        Args:
+            nrql: NRQL query string
+
+        Returns:
+            16-byte digest key
+        """
+        return hashlib.blake2b(nrql.encode(), digest_size=16).digest()
+
+    def _get_from_cache(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Look up a fresh cached result.
+
+        Expired entries are retained (still bounded by the LRU size cap)
+        so that query() can revalidate them with If-None-Match rather
+        than re-downloading an unchanged body.
+
+        Args:
+            key: Cache key from _cache_key()
+
+        Returns:
+            Cached result or None on miss/expiry
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        timestamp, raw, _etag = entry
+        if time.time() - timestamp > self._config.cache_ttl_s:
+            return None
+
+        # Mark as most recently used; deserialize so the caller gets a
+        # fresh, independently mutable copy (cheaper than deepcopy).
+        self._cache.move_to_end(key)
+        return json_loads(raw)
+
+    def _get_stale_etag(self, key: bytes) -> Optional[str]:
+        """
+        Get the ETag recorded for an expired cache entry, if any.
+
+        Args:
+            key: Cache key from _cache_key()
+
+        Returns:
+            ETag of the stale entry, or None if absent
+        """
+        entry = self._cache.get(key)
+        return entry[2] if entry is not None else None
+
+    def _build_httpx_client(self) -> "httpx.Client":
+        """
+        Build an HTTP/2 httpx client for the httpx-h2 transport.
+
+        A single multiplexed connection carries all in-flight requests,
+        so concurrent query_many workers share one TLS session instead
+        of opening a socket each.
+
+        Returns:
+            Configured httpx client
+
+        Raises:
+            RuntimeError: If the httpx package is not installed
+        """
+        if httpx is None:
+            raise RuntimeError(
+                "transport='httpx-h2' requires the httpx package "
+                "(pip install 'httpx[http2]')"
+            )
+        return httpx.Client(
+            http2=True,
+            timeout=self._config.timeout_s,
+            headers=self._get_headers(),
+            limits=httpx.Limits(max_keepalive_connections=1, max_connections=1)
+        )
+
+    def _refresh_cache_entry(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Re-arm an expired entry's TTL after a 304 revalidation.
+
+        Args:
+            key: Cache key from _cache_key()
+
+        Returns:
+            The revalidated result, or None if the entry vanished
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        _timestamp, raw, etag = entry
+        self._cache[key] = (time.time(), raw, etag)
+        self._cache.move_to_end(key)
+        return json_loads(raw)
+
+    def _store_in_cache(self, key: bytes, data: Dict[str, Any],
+                        etag: Optional[str] = None) -> None:
+        """
+        Store a result, evicting least-recently-used entries when full.
+
+        Args:
+            key: Cache key from _cache_key()
+            data: Query result to cache
+            etag: ETag from the originating response, for revalidation
+        """
+        if self._config.cache_max_entries <= 0:
+            return
+
+        self._cache[key] = (time.time(), json_dumps_bytes(data), etag)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._config.cache_max_entries:
+            self._cache.popitem(last=False)
+
+    def _get_headers(self) -> Dict[str, str]:
+        """
+        Get default request headers.
+
+        Returns:
+            Headers for GraphQL requests
+        """
+        return {
+            "Content-Type": "application/json",
+            "API-Key": self._config.api_key
+        }
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "NRDBClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def _default_config() -> NRDBConfig:
         """
         Get default configuration from environment variables.
-        
+
+        Memoized: the environment is read once per process (matching the
+        _default_dirs helpers elsewhere), so every default client lookup
+        stops paying four env probes. Callers must not mutate the
+        returned config.
+
         Returns:
             Default configuration
         """
         return NRDBConfig(
-            api_key=os.environ.get("NEW_RELIC_API_KEY", ""),
+            api_key=api_key_from_env(),
             account_id=os.environ.get("NEW_RELIC_ACCOUNT_ID", ""),
             region=os.environ.get("NEW_RELIC_REGION", "us"),
             timeout_s=int(os.environ.get("NEW_RELIC_TIMEOUT", "30"))
         )
     
-    def query(self, nrql: str) -> Dict[str, Any]:
+    def _endpoint_url(self) -> str:
+        """
+        Get the GraphQL endpoint URL for the configured region.
+
+        Returns:
+            Endpoint URL
+        """
+        base_url = "https://api.newrelic.com" if self._config.region == "us" else "https://api.eu.newrelic.com"
+        return f"{base_url}/graphql"
+
+    def _build_payload(self, nrql: str) -> Dict[str, Any]:
+        """
+        Build the GraphQL request payload for an NRQL query.
+
+        Args:
+            nrql: NRQL query string
+
+        Returns:
+            GraphQL payload dict
+        """
+        query = _NRQL_DOCUMENT % (self._config.account_id, nrql.replace('"', '\\"'))
+        return {"query": query}
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Parse a Retry-After header safely.
+
+        Accepts both delay-seconds and HTTP-date formats, clamping the
+        result to [0, 60] seconds so a misbehaving server cannot stall
+        callers for minutes.
+
+        Args:
+            value: Raw Retry-After header value
+
+        Returns:
+            Delay in seconds, or None if the value is missing/unparseable
+        """
+        if not value:
+            return None
+
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+                delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return None
+
+        return min(max(delay, 0.0), 60.0)
+
+    def _post_with_retries(self, url: str, json_body: Any,
+                           headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        POST with bounded retries, exponential backoff and full jitter.
+
+        Jitter prevents multiple clients (e.g. query_many workers) from
+        waking simultaneously and re-stampeding the API after a shared
+        outage or rate-limit burst. Total retry time is capped by
+        retry_deadline_s so CLI calls cannot hang for minutes.
+
+        Args:
+            url: Endpoint URL
+            json_body: JSON-serializable request body
+            headers: Extra per-request headers (e.g. If-None-Match)
+
+        Returns:
+            Successful response
+
+        Raises:
+            requests.exceptions.RequestException: If retries are exhausted
+        """
+        # Serialize once up front: passing json= would re-encode the
+        # payload inside the HTTP library on every retry attempt.
+        body = json_dumps_bytes(json_body)
+        if self._config.transport == "httpx-h2":
+            body_kwargs = {"content": body}
+        else:
+            body_kwargs = {"data": body}
+
+        deadline = time.time() + self._config.retry_deadline_s
+        retries = 0
+
+        while True:
+            try:
+                response = self._session.post(
+                    url,
+                    headers=headers,
+                    timeout=self._config.timeout_s,
+                    **body_kwargs
+                )
+            except self._transport_errors:
+                if retries >= self._config.max_retries or time.time() >= deadline:
+                    raise
+                # Full jitter: uniform in [0, min(2^retries, 30)]
+                time.sleep(random.uniform(0, min(2 ** retries, 30)))
+                retries += 1
+                continue
+
+            if (
+                response.status_code == 429
+                and retries < self._config.max_retries
+                and time.time() < deadline
+            ):
+                delay = self._parse_retry_after(response.headers.get("Retry-After"))
+                if delay is None:
+                    delay = random.uniform(0, min(2 ** retries, 30))
+                time.sleep(min(delay, max(0.0, deadline - time.time())))
+                retries += 1
+                continue
+
+            response.raise_for_status()
+            return response
+
+    @staticmethod
+    def _is_persisted_query_miss(data: Dict[str, Any]) -> bool:
+        """
+        Check whether a GraphQL response reports an unknown persisted query.
+
+        Args:
+            data: Parsed GraphQL response
+
+        Returns:
+            True if the server asked for the full query to be retransmitted
+        """
+        for error in data.get("errors", []):
+            code = error.get("extensions", {}).get("code", "")
+            if code == "PERSISTED_QUERY_NOT_FOUND" or "PersistedQueryNotFound" in error.get("message", ""):
+                return True
+        return False
+
+    def _fetch_document(self, url: str, payload: Dict[str, Any],
+                        headers: Optional[Dict[str, str]] = None
+                        ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        POST a GraphQL payload and parse the response document.
+
+        When use_persisted_queries is enabled, first send only the APQ
+        sha256 hash of the document (saving the multi-hundred-byte query
+        upload on hot paths) and fall back to the full query if the
+        server does not know the hash yet.
+
+        Args:
+            url: Endpoint URL
+            payload: GraphQL payload with a "query" field
+            headers: Extra per-request headers (e.g. If-None-Match)
+
+        Returns:
+            Tuple of (parsed response, response ETag). The parsed
+            response is None when the server answered 304 Not Modified
+            to a conditional request.
+        """
+        if not self._config.use_persisted_queries:
+            response = self._post_with_retries(url, payload, headers=headers)
+            if response.status_code == 304:
+                return None, response.headers.get("ETag")
+            return json_loads(response.content), response.headers.get("ETag")
+
+        extensions = {
+            "persistedQuery": {
+                "version": 1,
+                "sha256Hash": _persisted_query_hash(payload["query"])
+            }
+        }
+
+        # Hash-only attempt first
+        slim_payload = {k: v for k, v in payload.items() if k != "query"}
+        slim_payload["extensions"] = extensions
+        response = self._post_with_retries(url, slim_payload, headers=headers)
+        if response.status_code == 304:
+            return None, response.headers.get("ETag")
+        data = json_loads(response.content)
+
+        if self._is_persisted_query_miss(data):
+            # Server has not seen this document yet; register it
+            full_payload = dict(payload)
+            full_payload["extensions"] = extensions
+            response = self._post_with_retries(url, full_payload, headers=headers)
+            data = json_loads(response.content)
+
+        return data, response.headers.get("ETag")
+
+    @staticmethod
+    def _check_graphql_errors(data: Dict[str, Any]) -> None:
+        """
+        Raise if a GraphQL response document contains errors.
+
+        Args:
+            data: Parsed GraphQL response
+
+        Raises:
+            RuntimeError: If the response carries a non-empty errors list
+        """
+        if "errors" in data:
+            error_message = "; ".join([error.get("message", "Unknown error") for error in data["errors"]])
+            raise RuntimeError(f"GraphQL error: {error_message}")
+
+    def query(self, nrql: str, use_cache: bool = False) -> Dict[str, Any]:
         """
         Execute an NRQL query.
-        
+
         Args:
             nrql: NRQL query string
-            
+            use_cache: Whether to serve/store results from the client cache
+
         Returns:
             Query result
-            
+
         Raises:
             ValueError: If API key or account ID is missing
             RuntimeError: If circuit breaker is open
@@ -135,67 +677,188 @@ class NRDBClient:
         """
         if not self._config.api_key:
             raise ValueError("NEW_RELIC_API_KEY environment variable or config is required")
-        
+
         if not self._config.account_id:
             raise ValueError("NEW_RELIC_ACCOUNT_ID environment variable or config is required")
-        
+
+        # Serve from cache if allowed; stale entries with an ETag are
+        # revalidated with If-None-Match so an unchanged body costs a
+        # 304 instead of a full re-download.
+        cache_key = None
+        conditional_headers = None
+        if use_cache:
+            cache_key = self._cache_key(nrql)
+            cached = self._get_from_cache(cache_key)
+            if cached is not None:
+                return cached
+            stale_etag = self._get_stale_etag(cache_key)
+            if stale_etag:
+                conditional_headers = {"If-None-Match": stale_etag}
+
         # Check circuit breaker
         if self._circuit_breaker.is_open:
             raise RuntimeError("Circuit breaker is open, NRDB may be experiencing issues")
-        
-        # Determine API endpoint based on region
-        base_url = "https://api.newrelic.com" if self._config.region == "us" else "https://api.eu.newrelic.com"
-        url = f"{base_url}/graphql"
-        
-        # Prepare request
-        headers = {
-            "Content-Type": "application/json",
-            "API-Key": self._config.api_key
-        }
-        
-        query = """
-        {
-            actor {
-                account(id: %s) {
-                    nrql(query: "%s") {
-                        results
-                    }
-                }
-            }
-        }
-        """ % (self._config.account_id, nrql.replace('"', '\\"'))
-        
-        payload = {"query": query}
-        
+
+        url = self._endpoint_url()
+        payload = self._build_payload(nrql)
+
         try:
             start_time = time.time()
-            response = requests.post(
-                url,
-                headers=headers,
-                json=payload,
-                timeout=self._config.timeout_s
-            )
-            response.raise_for_status()
-            
+            data, etag = self._fetch_document(url, payload, headers=conditional_headers)
+
             # Record success
             self._circuit_breaker.record_success()
-            
-            # Parse response
-            data = response.json()
-            
+
+            if data is None and cache_key is not None:
+                # 304 Not Modified: the stale entry is still current
+                revalidated = self._refresh_cache_entry(cache_key)
+                if revalidated is not None:
+                    return revalidated
+                raise RuntimeError("Received 304 but cache entry is gone")
+
             # Check for errors in the GraphQL response
-            if "errors" in data:
-                error_message = "; ".join([error.get("message", "Unknown error") for error in data["errors"]])
-                raise RuntimeError(f"GraphQL error: {error_message}")
-            
+            self._check_graphql_errors(data)
+
             # Extract results
-            results = data.get("data", {}).get("actor", {}).get("account", {}).get("nrql", {}).get("results", [])
-            return {
+            results = extract_nrql_results(data)
+            result = {
                 "results": results,
                 "duration_ms": (time.time() - start_time) * 1000
             }
+
+            if cache_key is not None:
+                self._store_in_cache(cache_key, result, etag=etag)
+
+            return result
             
-        except (requests.exceptions.RequestException, KeyError, json.JSONDecodeError) as e:
+        except self._transport_errors + (KeyError, json.JSONDecodeError) as e:
             # Record failure
             self._circuit_breaker.record_failure()
             raise
+
+    def query_batch(self, nrqls: List[str], use_cache: bool = False) -> List[Dict[str, Any]]:
+        """
+        Execute multiple NRQL queries in a single HTTP round-trip.
+
+        Posts a JSON array of GraphQL documents (Apollo-style request
+        batching), collapsing N network round-trips into one and
+        counting once against API rate limits. Cached entries are served
+        locally; only misses are sent over the wire.
+
+        Args:
+            nrqls: NRQL query strings
+            use_cache: Whether to serve/store results from the client cache
+
+        Returns:
+            Query results in the same order as the input queries
+
+        Raises:
+            Same exceptions as query()
+        """
+        if not nrqls:
+            return []
+
+        if not self._config.api_key:
+            raise ValueError("NEW_RELIC_API_KEY environment variable or config is required")
+
+        if not self._config.account_id:
+            raise ValueError("NEW_RELIC_ACCOUNT_ID environment variable or config is required")
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(nrqls)
+
+        # Resolve cache hits first; only misses go over the wire
+        pending = []
+        for i, nrql in enumerate(nrqls):
+            if use_cache:
+                cached = self._get_from_cache(self._cache_key(nrql))
+                if cached is not None:
+                    results[i] = cached
+                    continue
+            pending.append(i)
+
+        if not pending:
+            return results
+
+        if self._circuit_breaker.is_open:
+            raise RuntimeError("Circuit breaker is open, NRDB may be experiencing issues")
+
+        payloads = [self._build_payload(nrqls[i]) for i in pending]
+
+        try:
+            start_time = time.time()
+            response = self._post_with_retries(self._endpoint_url(), payloads)
+
+            self._circuit_breaker.record_success()
+
+            duration_ms = (time.time() - start_time) * 1000
+            documents = json_loads(response.content)
+
+            for i, data in zip(pending, documents):
+                self._check_graphql_errors(data)
+
+                result = {
+                    "results": extract_nrql_results(data),
+                    "duration_ms": duration_ms
+                }
+
+                if use_cache:
+                    self._store_in_cache(self._cache_key(nrqls[i]), result)
+
+                results[i] = result
+
+            return results
+
+        except self._transport_errors + (KeyError, json.JSONDecodeError) as e:
+            # Record failure
+            self._circuit_breaker.record_failure()
+            raise
+
+    def query_many_iter(self, nrqls: List[str], max_workers: int = 4) -> Iterator[Dict[str, Any]]:
+        """
+        Execute multiple NRQL queries concurrently, yielding results.
+
+        Queries are network-latency-bound, so overlapping them with a
+        small thread pool hides the per-request round-trip time. The
+        pooled session is shared between workers (requests.Session is
+        thread-safe for this usage).
+
+        Results are yielded in input order as they complete, so callers
+        folding a reduction (sum, histogram merge) never hold more than
+        a bounded number of result payloads in memory at once.
+
+        Args:
+            nrqls: NRQL query strings
+            max_workers: Maximum number of concurrent requests
+
+        Yields:
+            Query results in the same order as the input queries
+
+        Raises:
+            Same exceptions as query()
+        """
+        if not nrqls:
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(nrqls))
+        ) as executor:
+            yield from executor.map(self.query, nrqls)
+
+    def query_many(self, nrqls: List[str], max_workers: int = 4) -> List[Dict[str, Any]]:
+        """
+        Execute multiple NRQL queries concurrently.
+
+        Convenience wrapper around query_many_iter() that materializes
+        the full result list.
+
+        Args:
+            nrqls: NRQL query strings
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Query results in the same order as the input queries
+
+        Raises:
+            Same exceptions as query()
+        """
+        return list(self.query_many_iter(nrqls, max_workers=max_workers))
@@ -6,11 +6,12 @@ are functioning correctly by checking actual data ingest against expectations.
 """
 
 import logging
-import time
-import requests
+import random
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+from zcp_validate.nrdb_client import escape_nrql_string, get_shared_client
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -71,8 +72,15 @@ def validate_hosts(hosts: List[str], expected_gib_day: float, threshold: float =
     Returns:
         Summary of validation results
     """
-    logger.info(f"Validating {len(hosts)} hosts against expected ingest of {expected_gib_day:.2f} GiB/day")
-    
+    # Nothing to validate: return an empty summary without touching the
+    # network or the dummy-data generator
+    if not hosts:
+        summary = ValidationSummary(pass_count=0, fail_count=0, hosts_validated=0, results={})
+        logger.info("%s", summary)
+        return summary
+
+    logger.info("Validating %d hosts against expected ingest of %.2f GiB/day", len(hosts), expected_gib_day)
+
     # If API key or account ID not provided, use dummy data
     use_dummy_data = not (api_key and account_id)
     if use_dummy_data:
@@ -84,14 +92,16 @@ def validate_hosts(hosts: List[str], expected_gib_day: float, threshold: float =
         # Generate dummy data that's close to the expected value
         for hostname in hosts:
             # Simulate some variation in the data
-            import random
             variation = random.uniform(-0.15, 0.15)  # +/- 15%
             actual_gib_day = expected_gib_day * (1 + variation)
-            
-            # Calculate deviation
-            deviation = abs(actual_gib_day - expected_gib_day) / expected_gib_day
+
+            # The deviation ratio is the sampled variation by
+            # construction; deriving it directly skips a subtract and a
+            # divide per host and keeps a zero expectation from
+            # dividing by zero
+            deviation = abs(variation)
             within_threshold = deviation <= threshold
-            
+
             results[hostname] = ValidationResult(
                 hostname=hostname,
                 expected_gib_day=expected_gib_day,
@@ -103,7 +113,7 @@ def validate_hosts(hosts: List[str], expected_gib_day: float, threshold: float =
         # Query New Relic for actual data
         try:
             # Build host filter
-            host_filter = " OR ".join([f"hostname = '{host}'" for host in hosts])
+            host_filter = " OR ".join([f"hostname = '{escape_nrql_string(host)}'" for host in hosts])
             
             # Build query
             query = f"""
@@ -114,44 +124,23 @@ def validate_hosts(hosts: List[str], expected_gib_day: float, threshold: float =
             SINCE 24 HOURS AGO
             """
             
-            # Execute query
-            url = "https://api.newrelic.com/graphql"
-            headers = {
-                "Content-Type": "application/json",
-                "API-Key": api_key
-            }
-            
-            payload = {
-                "query": f"""
-                {{
-                    actor {{
-                        account(id: {account_id}) {{
-                            nrql(query: "{query}") {{
-                                results
-                            }}
-                        }}
-                    }}
-                }}
-                """
-            }
-            
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Extract results
-            query_results = data.get("data", {}).get("actor", {}).get("account", {}).get("nrql", {}).get("results", [])
-            
+            # Execute through the process-wide shared client with caching
+            # enabled: repeated validations of the same host set within the
+            # cache TTL reuse the fetched dataset instead of re-posting the
+            # query, and the client's warm TLS pool is shared with the
+            # full Validator path
+            data = get_shared_client(api_key, account_id).query(query, use_cache=True)
+
+            # Index results by hostname once, instead of re-scanning the
+            # full result list for every host
+            query_results = data.get("results", [])
+            ingest_by_host = {r.get("hostname"): r.get("giBIngested", 0.0)
+                              for r in query_results}
+
             # Process results for each host
             for hostname in hosts:
-                # Find this host in the results
-                host_data = next((r for r in query_results if r.get("hostname") == hostname), None)
-                
-                if host_data:
-                    actual_gib_day = host_data.get("giBIngested", 0.0)
-                else:
-                    # Host not found in results
-                    actual_gib_day = 0.0
+                # Hosts missing from the results report zero ingest
+                actual_gib_day = ingest_by_host.get(hostname, 0.0)
                 
                 # Calculate deviation
                 deviation = abs(actual_gib_day - expected_gib_day) / expected_gib_day if expected_gib_day > 0 else 1.0
@@ -189,9 +178,10 @@ def validate_hosts(hosts: List[str], expected_gib_day: float, threshold: float =
         results=results
     )
     
-    # Log results
-    logger.info(str(summary))
+    # Log results; %-style args defer the per-host str() builds until
+    # the logging framework knows the level is enabled
+    logger.info("%s", summary)
     for result in results.values():
-        logger.info(str(result))
+        logger.info("%s", result)
     
     return summary
@@ -5,10 +5,18 @@ Validator implementation for checking configurations against actual data.
 import time
 from typing import Dict, List, Optional
 
-from zcp_core.bus import Event, publish
+# publish_sync is bound to the local name publish: these modules run in
+# synchronous code, and the async publish() coroutine was being created
+# and dropped without ever running
+from zcp_core.bus import Event, publish_sync as publish
 from zcp_core.schema import validate as validate_schema
 from zcp_validate.models import HostValidationResult, ValidationJob, ValidationResult
-from zcp_validate.nrdb_client import NRDBClient, NRDBConfig
+from zcp_validate.nrdb_client import NRDBClient, default_shared_client, escape_nrql_string
+
+# Hosts per NRQL query: beyond this the WHERE clause risks the
+# query-length limit, so larger jobs are split into chunks and sent
+# together via query_batch (one HTTP round-trip for all chunks)
+_MAX_HOSTS_PER_QUERY = 1000
 
 
 class Validator:
@@ -21,9 +29,9 @@ class Validator:
         Initialize validator.
         
         Args:
-            nrdb_client: NRDB client to use (or create a new one)
+            nrdb_client: NRDB client to use (default: process-wide shared client)
         """
-        self._nrdb_client = nrdb_client or NRDBClient()
+        self._nrdb_client = nrdb_client or default_shared_client()
     
     def validate(self, job: ValidationJob) -> ValidationResult:
         """
@@ -37,7 +45,22 @@ class Validator:
         """
         start_time = time.time()
         host_results = {}
-        
+
+        # A client with no credentials cannot answer any query; fail all
+        # hosts up front instead of building and escaping the NRQL for
+        # the whole host list only to have query() reject it
+        if not getattr(self._nrdb_client, "has_credentials", True):
+            for host in job.hosts:
+                host_results[host] = HostValidationResult(
+                    hostname=host,
+                    expected_gib_day=job.expected_gib_day,
+                    actual_gib_day=0.0,
+                    within_threshold=False,
+                    deviation_percent=100.0,
+                    message="Error querying NRDB: no API credentials configured"
+                )
+            return self._finish_result(host_results, start_time)
+
         # Query NRDB for actual ingest data
         try:
             # Get ingest data for all hosts in one query
@@ -46,10 +69,13 @@ class Validator:
                 timeframe_hours=job.timeframe_hours
             )
             
-            # Process results for each host
+            # Index results once, then process each host. A per-host scan
+            # of the result list would be O(hosts x results).
+            ingest_by_host = self._index_host_ingest(query_result)
+
             for host in job.hosts:
                 # Get actual ingest for this host
-                actual_gib_day = self._extract_host_ingest(query_result, host)
+                actual_gib_day = ingest_by_host.get(host, 0.0)
                 
                 # Calculate deviation
                 deviation = abs(actual_gib_day - job.expected_gib_day) / job.expected_gib_day if job.expected_gib_day > 0 else 0
@@ -77,23 +103,37 @@ class Validator:
                     message=f"Error querying NRDB: {str(e)}"
                 )
         
+        return self._finish_result(host_results, start_time)
+
+    def _finish_result(self, host_results: Dict[str, HostValidationResult],
+                       start_time: float) -> ValidationResult:
+        """
+        Assemble the ValidationResult and emit its side effects.
+
+        Args:
+            host_results: Per-host results collected by validate()
+            start_time: Wall-clock start of the validation
+
+        Returns:
+            Validation result
+        """
         # Calculate pass rate
         pass_count = sum(1 for r in host_results.values() if r.within_threshold)
         pass_rate = pass_count / len(host_results) if host_results else 0.0
-        
+
         # Create validation result
         result = ValidationResult(
             host_results=host_results,
             query_duration_ms=(time.time() - start_time) * 1000,
             pass_rate=pass_rate
         )
-        
+
         # Validate against schema
         try:
             validate_schema(result.dict(), "ValidationResult")
         except Exception as e:
             print(f"Warning: Schema validation failed: {e}")
-        
+
         # Publish event
         publish(Event(
             topic="validate.result",
@@ -102,58 +142,81 @@ class Validator:
                 "actual_gib_day": sum(r.actual_gib_day for r in host_results.values()) / len(host_results) if host_results else 0.0
             }
         ))
-        
+
         return result
-    
+
     def _query_actual_ingest(self, hosts: List[str], timeframe_hours: int) -> Dict:
         """
         Query NRDB for actual ingest data.
-        
+
+        Host lists above _MAX_HOSTS_PER_QUERY are split into per-chunk
+        queries issued through query_batch, so even large jobs cost a
+        single HTTP round-trip instead of one request per chunk.
+
         Args:
             hosts: List of hosts to query
             timeframe_hours: Timeframe in hours
-            
+
         Returns:
             Query result
         """
-        # Build host filter
-        host_filter = " OR ".join([f"hostname = '{host}'" for host in hosts])
-        
-        # Build NRQL query
-        nrql = f"""
-        FROM NrConsumption 
-        SELECT sum(bytesIngested)/1024/1024/1024 as giBIngested 
+        nrqls = [
+            self._build_ingest_nrql(hosts[i:i + _MAX_HOSTS_PER_QUERY], timeframe_hours)
+            for i in range(0, len(hosts), _MAX_HOSTS_PER_QUERY)
+        ]
+
+        if len(nrqls) == 1:
+            return self._nrdb_client.query(nrqls[0])
+
+        # Merge per-chunk results into one document
+        merged: Dict = {"results": [], "duration_ms": 0.0}
+        for chunk_result in self._nrdb_client.query_batch(nrqls):
+            merged["results"].extend(chunk_result.get("results", []))
+            merged["duration_ms"] += chunk_result.get("duration_ms", 0.0)
+        return merged
+
+    @staticmethod
+    def _build_ingest_nrql(hosts: List[str], timeframe_hours: int) -> str:
+        """
+        Build the ingest NRQL query for a set of hosts.
+
+        Args:
+            hosts: Hosts to include in the WHERE clause
+            timeframe_hours: Timeframe in hours
+
+        Returns:
+            NRQL query string
+        """
+        # Build host filter; escape hostnames so plan-supplied values
+        # cannot break out of the NRQL string literal
+        host_filter = " OR ".join([f"hostname = '{escape_nrql_string(host)}'" for host in hosts])
+
+        return f"""
+        FROM NrConsumption
+        SELECT sum(bytesIngested)/1024/1024/1024 as giBIngested
         WHERE metricName='ProcessSample' AND ({host_filter})
         FACET hostname
         SINCE {timeframe_hours} HOURS AGO
         """
-        
-        # Execute query
-        return self._nrdb_client.query(nrql)
     
-    def _extract_host_ingest(self, query_result: Dict, hostname: str) -> float:
+    def _index_host_ingest(self, query_result: Dict) -> Dict[str, float]:
         """
-        Extract actual ingest for a host from query results.
-        
+        Index actual ingest per host from query results in a single pass.
+
         Args:
             query_result: NRDB query result
-            hostname: Host to extract
-            
+
         Returns:
-            Actual ingest in GiB/day
+            Mapping of hostname to actual ingest in GiB/day
         """
-        # Extract results for this host
         results = query_result.get("results", [])
         timeframe_hours = 24  # Default timeframe
-        
-        for result in results:
-            if result.get("hostname") == hostname:
-                # Convert to GiB/day
-                gib_ingested = result.get("giBIngested", 0.0)
-                return (gib_ingested / timeframe_hours) * 24
-        
-        # Host not found in results
-        return 0.0
+
+        return {
+            result["hostname"]: (result.get("giBIngested", 0.0) / timeframe_hours) * 24
+            for result in results
+            if "hostname" in result
+        }
     
     @staticmethod
     def _generate_message(actual: float, expected: float, deviation: float, within_threshold: bool) -> str:
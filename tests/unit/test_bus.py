@@ -17,6 +17,7 @@ from zcp_core.bus import (
     SyncMemBackend,
     _backend,
     publish,
+    publish_sync,
     shutdown,
     subscribe,
 )
@@ -84,6 +85,25 @@ async def test_sync_backend(clean_bus):
     assert sub3.events[0].event_id == event.event_id
 
 
+def test_publish_sync_with_subscriber(clean_bus):
+    """Test publishing from synchronous code with a subscriber attached."""
+    # Set up subscriber
+    sub = TestSubscriber("test.topic")
+    subscribe(sub)
+
+    # Publish from a plain sync context - no event loop running
+    event = Event(
+        ts=datetime.now(),
+        topic="test.topic",
+        payload={"key": "value"}
+    )
+    publish_sync(event)
+
+    # Handler must have run to completion before publish_sync returns
+    assert len(sub.events) == 1
+    assert sub.events[0].event_id == event.event_id
+
+
 @pytest.mark.asyncio
 async def test_global_publish_subscribe(clean_bus):
     """Test global publish and subscribe functions."""